@@ -2,10 +2,6 @@
 Python bindings for GLFW.
 """
 
-from __future__ import print_function
-from __future__ import division
-from __future__ import unicode_literals
-
 __author__ = 'Florian Rhiem (florian.rhiem@gmail.com)'
 __copyright__ = 'Copyright (c) 2013-2024 Florian Rhiem'
 __license__ = 'MIT'
@@ -29,13 +25,23 @@ ERROR_REPORTING = 'warn'
 # to disable this behavior and use integral values between 0 and 65535.
 NORMALIZE_GAMMA_RAMPS = True
 
+# By default (RERAISE_CALLBACK_EXCEPTIONS = True), exceptions raised in
+# callbacks are stored and re-raised once control returns from the GLFW
+# function that called the callback, e.g. poll_events. Set
+# RERAISE_CALLBACK_EXCEPTIONS to False before setting callbacks if you want
+# them to be called without this wrapper, saving some overhead on every call.
+# Exceptions raised in these callbacks will be printed and ignored by ctypes.
+RERAISE_CALLBACK_EXCEPTIONS = True
+
 import collections
 import ctypes
 import logging
 import os
 import functools
+import struct
 import sys
 import warnings
+import weakref
 
 from .library import glfw as _glfw
 
@@ -59,21 +65,6 @@ if _PREVIEW is None:
 else:
     _PREVIEW = bool(_PREVIEW)
 
-# Python 3 compatibility:
-try:
-    _getcwd = os.getcwdu
-except AttributeError:
-    _getcwd = os.getcwd
-if sys.version_info.major > 2:
-    _to_char_p = lambda s: s.encode('utf-8')
-    def _reraise(exception, traceback):
-        raise exception.with_traceback(traceback)
-else:
-    _to_char_p = lambda s: s
-    def _reraise(exception, traceback):
-        # wrapped in exec, as python 3 does not support this variant of raise
-        exec("raise exception, None, traceback")
-
 # support for CFFI pointers for Vulkan objects
 try:
     from cffi import FFI
@@ -83,7 +74,8 @@ else:
     ffi = FFI()
     def _cffi_to_ctypes_void_p(ptr):
         if isinstance(ptr, ffi.CData):
-            return ctypes.cast(int(ffi.cast('uintptr_t', ptr)), ctypes.c_void_p)
+            # c_void_p arguments accept addresses as int
+            return int(ffi.cast('uintptr_t', ptr))
         return ptr
 
 
@@ -98,6 +90,28 @@ class GLFWError(UserWarning):
 
 _callback_repositories = []
 
+# Creating namedtuple instances through tuple.__new__ skips the Python-level
+# __new__ of the namedtuple classes, which is noticeably faster for structs
+# that are unwrapped frequently, e.g. gamepad states polled every frame.
+_namedtuple_new = tuple.__new__
+
+# ctypes names used by the getters that are commonly called every frame,
+# bound to module-level names to avoid the attribute lookups.
+_byref = ctypes.byref
+_c_int = ctypes.c_int
+_c_float = ctypes.c_float
+_c_double = ctypes.c_double
+
+
+def _handle_addr(handle):
+    """
+    Returns the address of a window, monitor or cursor pointer, used as key
+    for the callback and user data repositories.
+    """
+    if not handle:
+        return None
+    return ctypes.addressof(handle.contents)
+
 
 class _GLFWwindow(ctypes.Structure):
     """
@@ -158,9 +172,14 @@ class _GLFWvidmode(ctypes.Structure):
         """
         Returns a GLFWvidmode object.
         """
-        size = self.Size(self.width, self.height)
-        bits = self.Bits(self.red_bits, self.green_bits, self.blue_bits)
-        return self.GLFWvidmode(size, bits, self.refresh_rate)
+        size = _namedtuple_new(self.Size, (self.width, self.height))
+        bits = _namedtuple_new(self.Bits, (self.red_bits, self.green_bits,
+                                           self.blue_bits))
+        return _namedtuple_new(self.GLFWvidmode,
+                               (size, bits, self.refresh_rate))
+
+    # Layout of the structure for unpacking arrays of video modes at once.
+    struct_format = struct.Struct('5iI')
 
 
 class _GLFWgammaramp(ctypes.Structure):
@@ -195,21 +214,18 @@ class _GLFWgammaramp(ctypes.Structure):
         size = min(len(red), len(green), len(blue))
         array_type = ctypes.c_ushort*size
         self.size = ctypes.c_uint(size)
-        self.red_array = array_type()
-        self.green_array = array_type()
-        self.blue_array = array_type()
         if NORMALIZE_GAMMA_RAMPS:
             red = [value * 65535 for value in red]
             green = [value * 65535 for value in green]
             blue = [value * 65535 for value in blue]
-        for i in range(self.size):
-            self.red_array[i] = int(red[i])
-            self.green_array[i] = int(green[i])
-            self.blue_array[i] = int(blue[i])
-        pointer_type = ctypes.POINTER(ctypes.c_ushort)
-        self.red = ctypes.cast(self.red_array, pointer_type)
-        self.green = ctypes.cast(self.green_array, pointer_type)
-        self.blue = ctypes.cast(self.blue_array, pointer_type)
+        # initializing the arrays at once is faster than setting each element
+        self.red_array = array_type(*map(int, red[:size]))
+        self.green_array = array_type(*map(int, green[:size]))
+        self.blue_array = array_type(*map(int, blue[:size]))
+        # arrays can be assigned to pointer fields directly, no cast needed
+        self.red = self.red_array
+        self.green = self.green_array
+        self.blue = self.blue_array
 
     def unwrap(self):
         """
@@ -222,7 +238,7 @@ class _GLFWgammaramp(ctypes.Structure):
             red = [value / 65535.0 for value in red]
             green = [value / 65535.0 for value in green]
             blue = [value / 65535.0 for value in blue]
-        return self.GLFWgammaramp(red, green, blue)
+        return _namedtuple_new(self.GLFWgammaramp, (red, green, blue))
 
 
 class _GLFWcursor(ctypes.Structure):
@@ -261,27 +277,29 @@ class _GLFWimage(ctypes.Structure):
             # Treat image as PIL/pillow Image object
             self.width, self.height = image.size
             array_type = ctypes.c_ubyte * 4 * (self.width * self.height)
-            self.pixels_array = array_type()
-            pixels = image.convert('RGBA').getdata()
-            for i, pixel in enumerate(pixels):
-                self.pixels_array[i] = pixel
+            pixels = image.convert('RGBA').tobytes()
+            self.pixels_array = array_type.from_buffer_copy(pixels)
         else:
             self.width, self.height, pixels = image
             array_type = ctypes.c_ubyte * 4 * self.width * self.height
-            self.pixels_array = array_type()
+            # collect the channel values and copy them at once, which is much
+            # faster than setting each element of the nested array
+            values = []
             for i in range(self.height):
+                row = pixels[i]
                 for j in range(self.width):
-                    for k in range(4):
-                        self.pixels_array[i][j][k] = pixels[i][j][k]
-        pointer_type = ctypes.POINTER(ctypes.c_ubyte)
-        self.pixels = ctypes.cast(self.pixels_array, pointer_type)
+                    values.extend(row[j][:4])
+            self.pixels_array = array_type.from_buffer_copy(bytes(values))
+        self.pixels = ctypes.cast(self.pixels_array,
+                                  ctypes.POINTER(ctypes.c_ubyte))
 
     def unwrap(self):
         """
         Returns a GLFWimage object.
         """
         pixels = [[[int(c) for c in p] for p in l] for l in self.pixels_array]
-        return self.GLFWimage(self.width, self.height, pixels)
+        return _namedtuple_new(self.GLFWimage,
+                               (self.width, self.height, pixels))
 
 
 class _GLFWgamepadstate(ctypes.Structure):
@@ -296,10 +314,8 @@ class _GLFWgamepadstate(ctypes.Structure):
         'buttons', 'axes'
     ])
 
-    def __init__(self):
-        ctypes.Structure.__init__(self)
-        self.buttons = (ctypes.c_ubyte * 15)(* [0] * 15)
-        self.axes = (ctypes.c_float * 6)(* [0] * 6)
+    # no __init__, as ctypes already zero-initializes the arrays and this is
+    # created every time the gamepad state is polled
 
     def wrap(self, gamepad_state):
         """
@@ -313,11 +329,13 @@ class _GLFWgamepadstate(ctypes.Structure):
 
     def unwrap(self):
         """
-        Returns a GLFWvidmode object.
+        Returns a GLFWgamepadstate object.
         """
-        buttons = [int(button) for button in self.buttons]
-        axes = [float(axis) for axis in self.axes]
-        return self.GLFWgamepadstate(buttons, axes)
+        # slicing a ctypes array of simple types already yields a list of
+        # Python ints/floats
+        buttons = self.buttons[:]
+        axes = self.axes[:]
+        return _namedtuple_new(self.GLFWgamepadstate, (buttons, axes))
 
 
 VERSION_MAJOR = 3
@@ -654,39 +672,47 @@ ANY_POSITION = 0x80000000
 DONT_CARE = -1
 
 
-_exc_info_from_callback = None
+# Single slot holding the exc_info of an exception raised in a callback. It is
+# a list so that the wrappers can access it as a closure variable instead of
+# looking up and rebinding a global on every call.
+_exc_info_from_callback = [None]
 def _callback_exception_decorator(func):
+    if not RERAISE_CALLBACK_EXCEPTIONS:
+        return func
+    exc_info_from_callback = _exc_info_from_callback
+
     @functools.wraps(func)
-    def callback_wrapper(*args, **kwargs):
-        global _exc_info_from_callback
-        if _exc_info_from_callback is not None:
+    def callback_wrapper(*args):
+        if exc_info_from_callback[0] is not None:
             # We are on the way back to Python after an exception was raised.
             # Do not call further callbacks and wait for the errcheck function
             # to handle the exception first.
             return
         try:
-            return func(*args, **kwargs)
+            return func(*args)
         except (KeyboardInterrupt, SystemExit):
             raise
         except:
-            _exc_info_from_callback = sys.exc_info()
+            exc_info_from_callback[0] = sys.exc_info()
     return callback_wrapper
 
 
 def _prepare_errcheck():
     """
     This function sets the errcheck attribute of all ctypes wrapped functions
-    to evaluate the _exc_info_from_callback global variable and re-raise any
-    exceptions that might have been raised in callbacks.
+    to evaluate the _exc_info_from_callback slot and re-raise any exceptions
+    that might have been raised in callbacks.
     It also modifies all callback types to automatically wrap the function
-    using the _callback_exception_decorator.
+    using the _callback_exception_decorator, or to return a NULL function
+    pointer for 0.
     """
+    exc_info_from_callback = _exc_info_from_callback
+
     def errcheck(result, *args):
-        global _exc_info_from_callback
-        if _exc_info_from_callback is not None:
-            exc = _exc_info_from_callback
-            _exc_info_from_callback = None
-            _reraise(exc[1], exc[2])
+        if exc_info_from_callback[0] is not None:
+            exc = exc_info_from_callback[0]
+            exc_info_from_callback[0] = None
+            raise exc[1].with_traceback(exc[2])
         return result
 
     for symbol in dir(_glfw):
@@ -696,11 +722,58 @@ def _prepare_errcheck():
     _globals = globals()
     for symbol in _globals:
         if symbol.startswith('_GLFW') and symbol.endswith('fun'):
-            def wrapper_cfunctype(func, cfunctype=_globals[symbol]):
+            cfunctype = _globals[symbol]
+            # 0 is used to unset a callback, all of these share a NULL pointer
+            def wrapper_cfunctype(func, cfunctype=cfunctype,
+                                  null_cfunc=cfunctype(0)):
+                if func == 0:
+                    return null_cfunc
                 return cfunctype(_callback_exception_decorator(func))
             _globals[symbol] = wrapper_cfunctype
 
 
+# Maps the callback type, the id of a python callback and the value of
+# RERAISE_CALLBACK_EXCEPTIONS to the ctypes function pointer created for it,
+# so that a callback which is set again reuses its existing function pointer,
+# unless RERAISE_CALLBACK_EXCEPTIONS was changed since. Entries are removed as
+# soon as the function pointer is no longer referenced. While it exists, it
+# keeps the python callback alive, so the id cannot be reused by another
+# object.
+_c_callback_registry = weakref.WeakValueDictionary()
+def _get_c_callback(cfunctype, cbfun):
+    key = (cfunctype, id(cbfun), bool(RERAISE_CALLBACK_EXCEPTIONS))
+    c_cbfun = _c_callback_registry.get(key)
+    if c_cbfun is None:
+        c_cbfun = cfunctype(cbfun)
+        _c_callback_registry[key] = c_cbfun
+    return c_cbfun
+
+
+def _set_window_callback(window, cbfun, callback_repository, cfunctype,
+                         glfw_setter):
+    """
+    Sets a window callback with the given GLFW function and stores the
+    python and ctypes callbacks in the callback repository. Returns the
+    previously set python callback, if any.
+    """
+    window_addr = _handle_addr(window)
+    if cbfun is None or cbfun == 0:
+        # the shared NULL function pointer needs no reference in the
+        # repository, so only the previous callback has to be removed
+        previous_callback = callback_repository.pop(window_addr, None)
+        c_cbfun = cfunctype(0)
+    else:
+        c_cbfun = _get_c_callback(cfunctype, cbfun)
+        previous_callback = callback_repository.get(window_addr)
+        if previous_callback is not None and previous_callback[1] is c_cbfun:
+            # the callback is already set, nothing to do
+            return cbfun
+        callback_repository[window_addr] = (cbfun, c_cbfun)
+    glfw_setter(window, c_cbfun)
+    if previous_callback is not None:
+        return previous_callback[0]
+
+
 _GLFWerrorfun = ctypes.CFUNCTYPE(None,
                                  ctypes.c_int,
                                  ctypes.c_char_p)
@@ -806,7 +879,7 @@ def init():
     Wrapper for:
         int glfwInit(void);
     """
-    cwd = _getcwd()
+    cwd = os.getcwd()
     res = _glfw.glfwInit()
     os.chdir(cwd)
     return res
@@ -822,10 +895,13 @@ def terminate():
     """
 
     for callback_repository in _callback_repositories:
-        for window_addr in list(callback_repository.keys()):
-            del callback_repository[window_addr]
-    for window_addr in list(_window_user_data_repository.keys()):
-        del _window_user_data_repository[window_addr]
+        callback_repository.clear()
+    _window_user_data_repository.clear()
+    _monitor_user_data_repository.clear()
+    _joystick_user_data_repository.clear()
+    _standard_cursor_repository.clear()
+    _standard_cursor_shapes.clear()
+    _instance_proc_address_cache.clear()
     _glfw.glfwTerminate()
 
 
@@ -885,9 +961,9 @@ if hasattr(_glfw, 'glfwGetError'):
         Wrapper for:
             int glfwGetError(const char** description);
         """
-        error_description = (ctypes.c_char_p * 1)()
-        error_code = _glfw.glfwGetError(error_description)
-        return error_code, error_description[0]
+        error_description = ctypes.c_char_p()
+        error_code = _glfw.glfwGetError(ctypes.byref(error_description))
+        return error_code, error_description.value
 
 
 @_callback_exception_decorator
@@ -937,7 +1013,7 @@ def set_error_callback(cbfun):
         cbfun = _handle_glfw_errors
         c_cbfun = _default_error_callback
     else:
-        c_cbfun = _GLFWerrorfun(cbfun)
+        c_cbfun = _get_c_callback(_GLFWerrorfun, cbfun)
     _error_callback = (cbfun, c_cbfun)
     cbfun = c_cbfun
     _glfw.glfwSetErrorCallback(cbfun)
@@ -954,8 +1030,7 @@ def get_monitors():
         GLFWmonitor** glfwGetMonitors(int* count);
     """
     count_value = ctypes.c_int(0)
-    count = ctypes.pointer(count_value)
-    result = _glfw.glfwGetMonitors(count)
+    result = _glfw.glfwGetMonitors(ctypes.byref(count_value))
     monitors = [result[i] for i in range(count_value.value)]
     return monitors
 
@@ -981,12 +1056,10 @@ def get_monitor_pos(monitor):
     Wrapper for:
         void glfwGetMonitorPos(GLFWmonitor* monitor, int* xpos, int* ypos);
     """
-    xpos_value = ctypes.c_int(0)
-    xpos = ctypes.pointer(xpos_value)
-    ypos_value = ctypes.c_int(0)
-    ypos = ctypes.pointer(ypos_value)
-    _glfw.glfwGetMonitorPos(monitor, xpos, ypos)
-    return xpos_value.value, ypos_value.value
+    xpos = ctypes.c_int(0)
+    ypos = ctypes.c_int(0)
+    _glfw.glfwGetMonitorPos(monitor, ctypes.byref(xpos), ctypes.byref(ypos))
+    return xpos.value, ypos.value
 
 
 if hasattr(_glfw, 'glfwGetMonitorWorkarea'):
@@ -1005,21 +1078,14 @@ if hasattr(_glfw, 'glfwGetMonitorWorkarea'):
         Wrapper for:
             void glfwGetMonitorWorkarea(GLFWmonitor* monitor, int* xpos, int* ypos, int* width, int* height);
         """
-        xpos_value = ctypes.c_int(0)
-        xpos = ctypes.pointer(xpos_value)
-        ypos_value = ctypes.c_int(0)
-        ypos = ctypes.pointer(ypos_value)
-        width_value = ctypes.c_int(0)
-        width = ctypes.pointer(width_value)
-        height_value = ctypes.c_int(0)
-        height = ctypes.pointer(height_value)
-        _glfw.glfwGetMonitorWorkarea(monitor, xpos, ypos, width, height)
-        return (
-            xpos_value.value,
-            ypos_value.value,
-            width_value.value,
-            height_value.value
-        )
+        xpos = ctypes.c_int(0)
+        ypos = ctypes.c_int(0)
+        width = ctypes.c_int(0)
+        height = ctypes.c_int(0)
+        _glfw.glfwGetMonitorWorkarea(monitor,
+                                     ctypes.byref(xpos), ctypes.byref(ypos),
+                                     ctypes.byref(width), ctypes.byref(height))
+        return xpos.value, ypos.value, width.value, height.value
 
 _glfw.glfwGetMonitorPhysicalSize.restype = None
 _glfw.glfwGetMonitorPhysicalSize.argtypes = [ctypes.POINTER(_GLFWmonitor),
@@ -1032,12 +1098,10 @@ def get_monitor_physical_size(monitor):
     Wrapper for:
         void glfwGetMonitorPhysicalSize(GLFWmonitor* monitor, int* width, int* height);
     """
-    width_value = ctypes.c_int(0)
-    width = ctypes.pointer(width_value)
-    height_value = ctypes.c_int(0)
-    height = ctypes.pointer(height_value)
-    _glfw.glfwGetMonitorPhysicalSize(monitor, width, height)
-    return width_value.value, height_value.value
+    width = ctypes.c_int(0)
+    height = ctypes.c_int(0)
+    _glfw.glfwGetMonitorPhysicalSize(monitor, ctypes.byref(width), ctypes.byref(height))
+    return width.value, height.value
 
 
 if hasattr(_glfw, 'glfwGetMonitorContentScale'):
@@ -1052,12 +1116,10 @@ if hasattr(_glfw, 'glfwGetMonitorContentScale'):
         Wrapper for:
             void glfwGetMonitorContentScale(GLFWmonitor* monitor, float* xscale, float* yscale);
         """
-        xscale_value = ctypes.c_float(0)
-        xscale = ctypes.pointer(xscale_value)
-        yscale_value = ctypes.c_float(0)
-        yscale = ctypes.pointer(yscale_value)
-        _glfw.glfwGetMonitorContentScale(monitor, xscale, yscale)
-        return xscale_value.value, yscale_value.value
+        xscale = ctypes.c_float(0)
+        yscale = ctypes.c_float(0)
+        _glfw.glfwGetMonitorContentScale(monitor, ctypes.byref(xscale), ctypes.byref(yscale))
+        return xscale.value, yscale.value
 
 
 _glfw.glfwGetMonitorName.restype = ctypes.c_char_p
@@ -1072,8 +1134,8 @@ def get_monitor_name(monitor):
     return _glfw.glfwGetMonitorName(monitor)
 
 
+_monitor_user_data_repository = {}
 if hasattr(_glfw, 'glfwSetMonitorUserPointer') and hasattr(_glfw, 'glfwGetMonitorUserPointer'):
-    _monitor_user_data_repository = {}
     _glfw.glfwSetMonitorUserPointer.restype = None
     _glfw.glfwSetMonitorUserPointer.argtypes = [ctypes.POINTER(_GLFWmonitor),
                                                 ctypes.c_void_p]
@@ -1097,8 +1159,7 @@ if hasattr(_glfw, 'glfwSetMonitorUserPointer') and hasattr(_glfw, 'glfwGetMonito
             pointer = ctypes.cast(ctypes.pointer(ctypes.py_object(pointer)),
                                   ctypes.c_void_p)
 
-        monitor_addr = ctypes.cast(ctypes.pointer(monitor),
-                                  ctypes.POINTER(ctypes.c_long)).contents.value
+        monitor_addr = _handle_addr(monitor)
         _monitor_user_data_repository[monitor_addr] = data
         _glfw.glfwSetMonitorUserPointer(monitor, pointer)
 
@@ -1114,14 +1175,11 @@ if hasattr(_glfw, 'glfwSetMonitorUserPointer') and hasattr(_glfw, 'glfwGetMonito
         Wrapper for:
             void* glfwGetMonitorUserPointer(int jid);
         """
-        monitor_addr = ctypes.cast(ctypes.pointer(monitor),
-                                  ctypes.POINTER(ctypes.c_long)).contents.value
+        monitor_addr = _handle_addr(monitor)
 
-        if monitor_addr in _monitor_user_data_repository:
-            data = _monitor_user_data_repository[monitor_addr]
-            is_wrapped_py_object = data[0]
-            if is_wrapped_py_object:
-                return data[1]
+        data = _monitor_user_data_repository.get(monitor_addr)
+        if data is not None and data[0]:
+            return data[1]
         return _glfw.glfwGetMonitorUserPointer(monitor)
 
 
@@ -1139,7 +1197,7 @@ def set_monitor_callback(cbfun):
     previous_callback = _monitor_callback
     if cbfun is None:
         cbfun = 0
-    c_cbfun = _GLFWmonitorfun(cbfun)
+    c_cbfun = _get_c_callback(_GLFWmonitorfun, cbfun)
     _monitor_callback = (cbfun, c_cbfun)
     cbfun = c_cbfun
     _glfw.glfwSetMonitorCallback(cbfun)
@@ -1157,9 +1215,23 @@ def get_video_modes(monitor):
         const GLFWvidmode* glfwGetVideoModes(GLFWmonitor* monitor, int* count);
     """
     count_value = ctypes.c_int(0)
-    count = ctypes.pointer(count_value)
-    result = _glfw.glfwGetVideoModes(monitor, count)
-    videomodes = [result[i].unwrap() for i in range(count_value.value)]
+    result = _glfw.glfwGetVideoModes(monitor, ctypes.byref(count_value))
+    if not result:
+        return []
+    # copy the whole array at once instead of unwrapping each structure
+    data = ctypes.string_at(result, count_value.value * ctypes.sizeof(_GLFWvidmode))
+    Size = _GLFWvidmode.Size
+    Bits = _GLFWvidmode.Bits
+    GLFWvidmode = _GLFWvidmode.GLFWvidmode
+    videomodes = [
+        _namedtuple_new(GLFWvidmode, (
+            _namedtuple_new(Size, (width, height)),
+            _namedtuple_new(Bits, (red_bits, green_bits, blue_bits)),
+            refresh_rate
+        ))
+        for width, height, red_bits, green_bits, blue_bits, refresh_rate
+        in _GLFWvidmode.struct_format.iter_unpack(data)
+    ]
     return videomodes
 
 _glfw.glfwGetVideoMode.restype = ctypes.POINTER(_GLFWvidmode)
@@ -1210,7 +1282,7 @@ def set_gamma_ramp(monitor, ramp):
     """
     gammaramp = _GLFWgammaramp()
     gammaramp.wrap(ramp)
-    _glfw.glfwSetGammaRamp(monitor, ctypes.pointer(gammaramp))
+    _glfw.glfwSetGammaRamp(monitor, ctypes.byref(gammaramp))
 
 _glfw.glfwDefaultWindowHints.restype = None
 _glfw.glfwDefaultWindowHints.argtypes = []
@@ -1247,7 +1319,9 @@ if hasattr(_glfw, 'glfwWindowHintString'):
         Wrapper for:
             void glfwWindowHintString(int hint, const char* value);
         """
-        _glfw.glfwWindowHintString(hint, _to_char_p(value))
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        _glfw.glfwWindowHintString(hint, value)
 
 
 _glfw.glfwCreateWindow.restype = ctypes.POINTER(_GLFWwindow)
@@ -1263,7 +1337,9 @@ def create_window(width, height, title, monitor, share):
     Wrapper for:
         GLFWwindow* glfwCreateWindow(int width, int height, const char* title, GLFWmonitor* monitor, GLFWwindow* share);
     """
-    return _glfw.glfwCreateWindow(width, height, _to_char_p(title),
+    if isinstance(title, str):
+        title = title.encode('utf-8')
+    return _glfw.glfwCreateWindow(width, height, title,
                                   monitor, share)
 
 _glfw.glfwDestroyWindow.restype = None
@@ -1276,16 +1352,14 @@ def destroy_window(window):
         void glfwDestroyWindow(GLFWwindow* window);
     """
     _glfw.glfwDestroyWindow(window)
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_ulong)).contents.value
+    window_addr = _handle_addr(window)
     for callback_repository in _callback_repositories:
-        if window_addr in callback_repository:
-            del callback_repository[window_addr]
-    if window_addr in _window_user_data_repository:
-        del _window_user_data_repository[window_addr]
+        callback_repository.pop(window_addr, None)
+    _window_user_data_repository.pop(window_addr, None)
 
 _glfw.glfwWindowShouldClose.restype = ctypes.c_int
 _glfw.glfwWindowShouldClose.argtypes = [ctypes.POINTER(_GLFWwindow)]
+_glfwWindowShouldClose = _glfw.glfwWindowShouldClose
 def window_should_close(window):
     """
     Checks the close flag of the specified window.
@@ -1293,11 +1367,12 @@ def window_should_close(window):
     Wrapper for:
         int glfwWindowShouldClose(GLFWwindow* window);
     """
-    return _glfw.glfwWindowShouldClose(window)
+    return _glfwWindowShouldClose(window)
 
 _glfw.glfwSetWindowShouldClose.restype = None
 _glfw.glfwSetWindowShouldClose.argtypes = [ctypes.POINTER(_GLFWwindow),
                                            ctypes.c_int]
+_glfwSetWindowShouldClose = _glfw.glfwSetWindowShouldClose
 def set_window_should_close(window, value):
     """
     Sets the close flag of the specified window.
@@ -1305,11 +1380,15 @@ def set_window_should_close(window, value):
     Wrapper for:
         void glfwSetWindowShouldClose(GLFWwindow* window, int value);
     """
-    _glfw.glfwSetWindowShouldClose(window, value)
+    _glfwSetWindowShouldClose(window, value)
 
 _glfw.glfwSetWindowTitle.restype = None
 _glfw.glfwSetWindowTitle.argtypes = [ctypes.POINTER(_GLFWwindow),
                                      ctypes.c_char_p]
+_glfwSetWindowTitle = _glfw.glfwSetWindowTitle
+# The last title passed to set_window_title and its UTF-8 encoding, as titles
+# are often set every frame without changing.
+_last_window_title = [(None, None)]
 def set_window_title(window, title):
     """
     Sets the title of the specified window.
@@ -1317,12 +1396,21 @@ def set_window_title(window, title):
     Wrapper for:
         void glfwSetWindowTitle(GLFWwindow* window, const char* title);
     """
-    _glfw.glfwSetWindowTitle(window, _to_char_p(title))
+    if isinstance(title, str):
+        last_title, last_encoded_title = _last_window_title[0]
+        if title == last_title:
+            title = last_encoded_title
+        else:
+            encoded_title = title.encode('utf-8')
+            _last_window_title[0] = (title, encoded_title)
+            title = encoded_title
+    _glfwSetWindowTitle(window, title)
 
 _glfw.glfwGetWindowPos.restype = None
 _glfw.glfwGetWindowPos.argtypes = [ctypes.POINTER(_GLFWwindow),
                                    ctypes.POINTER(ctypes.c_int),
                                    ctypes.POINTER(ctypes.c_int)]
+_glfwGetWindowPos = _glfw.glfwGetWindowPos
 def get_window_pos(window):
     """
     Retrieves the position of the client area of the specified window.
@@ -1330,17 +1418,16 @@ def get_window_pos(window):
     Wrapper for:
         void glfwGetWindowPos(GLFWwindow* window, int* xpos, int* ypos);
     """
-    xpos_value = ctypes.c_int(0)
-    xpos = ctypes.pointer(xpos_value)
-    ypos_value = ctypes.c_int(0)
-    ypos = ctypes.pointer(ypos_value)
-    _glfw.glfwGetWindowPos(window, xpos, ypos)
-    return xpos_value.value, ypos_value.value
+    xpos = _c_int(0)
+    ypos = _c_int(0)
+    _glfwGetWindowPos(window, _byref(xpos), _byref(ypos))
+    return xpos.value, ypos.value
 
 _glfw.glfwSetWindowPos.restype = None
 _glfw.glfwSetWindowPos.argtypes = [ctypes.POINTER(_GLFWwindow),
                                    ctypes.c_int,
                                    ctypes.c_int]
+_glfwSetWindowPos = _glfw.glfwSetWindowPos
 def set_window_pos(window, xpos, ypos):
     """
     Sets the position of the client area of the specified window.
@@ -1348,12 +1435,13 @@ def set_window_pos(window, xpos, ypos):
     Wrapper for:
         void glfwSetWindowPos(GLFWwindow* window, int xpos, int ypos);
     """
-    _glfw.glfwSetWindowPos(window, xpos, ypos)
+    _glfwSetWindowPos(window, xpos, ypos)
 
 _glfw.glfwGetWindowSize.restype = None
 _glfw.glfwGetWindowSize.argtypes = [ctypes.POINTER(_GLFWwindow),
                                     ctypes.POINTER(ctypes.c_int),
                                     ctypes.POINTER(ctypes.c_int)]
+_glfwGetWindowSize = _glfw.glfwGetWindowSize
 def get_window_size(window):
     """
     Retrieves the size of the client area of the specified window.
@@ -1361,17 +1449,16 @@ def get_window_size(window):
     Wrapper for:
         void glfwGetWindowSize(GLFWwindow* window, int* width, int* height);
     """
-    width_value = ctypes.c_int(0)
-    width = ctypes.pointer(width_value)
-    height_value = ctypes.c_int(0)
-    height = ctypes.pointer(height_value)
-    _glfw.glfwGetWindowSize(window, width, height)
-    return width_value.value, height_value.value
+    width = _c_int(0)
+    height = _c_int(0)
+    _glfwGetWindowSize(window, _byref(width), _byref(height))
+    return width.value, height.value
 
 _glfw.glfwSetWindowSize.restype = None
 _glfw.glfwSetWindowSize.argtypes = [ctypes.POINTER(_GLFWwindow),
                                     ctypes.c_int,
                                     ctypes.c_int]
+_glfwSetWindowSize = _glfw.glfwSetWindowSize
 def set_window_size(window, width, height):
     """
     Sets the size of the client area of the specified window.
@@ -1379,12 +1466,13 @@ def set_window_size(window, width, height):
     Wrapper for:
         void glfwSetWindowSize(GLFWwindow* window, int width, int height);
     """
-    _glfw.glfwSetWindowSize(window, width, height)
+    _glfwSetWindowSize(window, width, height)
 
 _glfw.glfwGetFramebufferSize.restype = None
 _glfw.glfwGetFramebufferSize.argtypes = [ctypes.POINTER(_GLFWwindow),
                                          ctypes.POINTER(ctypes.c_int),
                                          ctypes.POINTER(ctypes.c_int)]
+_glfwGetFramebufferSize = _glfw.glfwGetFramebufferSize
 def get_framebuffer_size(window):
     """
     Retrieves the size of the framebuffer of the specified window.
@@ -1392,12 +1480,10 @@ def get_framebuffer_size(window):
     Wrapper for:
         void glfwGetFramebufferSize(GLFWwindow* window, int* width, int* height);
     """
-    width_value = ctypes.c_int(0)
-    width = ctypes.pointer(width_value)
-    height_value = ctypes.c_int(0)
-    height = ctypes.pointer(height_value)
-    _glfw.glfwGetFramebufferSize(window, width, height)
-    return width_value.value, height_value.value
+    width = _c_int(0)
+    height = _c_int(0)
+    _glfwGetFramebufferSize(window, _byref(width), _byref(height))
+    return width.value, height.value
 
 
 if hasattr(_glfw, 'glfwGetWindowContentScale'):
@@ -1405,6 +1491,7 @@ if hasattr(_glfw, 'glfwGetWindowContentScale'):
     _glfw.glfwGetWindowContentScale.argtypes = [ctypes.POINTER(_GLFWwindow),
                                                 ctypes.POINTER(ctypes.c_float),
                                                 ctypes.POINTER(ctypes.c_float)]
+    _glfwGetWindowContentScale = _glfw.glfwGetWindowContentScale
     def get_window_content_scale(window):
         """
         Retrieves the content scale for the specified window.
@@ -1412,17 +1499,16 @@ if hasattr(_glfw, 'glfwGetWindowContentScale'):
         Wrapper for:
             void glfwGetWindowContentScale(GLFWwindow* window, float* xscale, float* yscale);
         """
-        xscale_value = ctypes.c_float(0)
-        xscale = ctypes.pointer(xscale_value)
-        yscale_value = ctypes.c_float(0)
-        yscale = ctypes.pointer(yscale_value)
-        _glfw.glfwGetWindowContentScale(window, xscale, yscale)
-        return xscale_value.value, yscale_value.value
+        xscale = _c_float(0)
+        yscale = _c_float(0)
+        _glfwGetWindowContentScale(window, _byref(xscale), _byref(yscale))
+        return xscale.value, yscale.value
 
 
 if hasattr(_glfw, 'glfwGetWindowOpacity'):
     _glfw.glfwGetWindowOpacity.restype = ctypes.c_float
     _glfw.glfwGetWindowOpacity.argtypes = [ctypes.POINTER(_GLFWwindow)]
+    _glfwGetWindowOpacity = _glfw.glfwGetWindowOpacity
     def get_window_opacity(window):
         """
         Returns the opacity of the whole window.
@@ -1430,13 +1516,14 @@ if hasattr(_glfw, 'glfwGetWindowOpacity'):
         Wrapper for:
             float glfwGetWindowOpacity(GLFWwindow* window);
         """
-        return _glfw.glfwGetWindowOpacity(window)
+        return _glfwGetWindowOpacity(window)
 
 
 if hasattr(_glfw, 'glfwSetWindowOpacity'):
     _glfw.glfwSetWindowOpacity.restype = None
     _glfw.glfwSetWindowOpacity.argtypes = [ctypes.POINTER(_GLFWwindow),
                                            ctypes.c_float]
+    _glfwSetWindowOpacity = _glfw.glfwSetWindowOpacity
     def set_window_opacity(window, opacity):
         """
         Sets the opacity of the whole window.
@@ -1444,8 +1531,7 @@ if hasattr(_glfw, 'glfwSetWindowOpacity'):
         Wrapper for:
             void glfwSetWindowOpacity(GLFWwindow* window, float opacity);
         """
-        opacity = ctypes.c_float(opacity)
-        _glfw.glfwSetWindowOpacity(window, opacity)
+        _glfwSetWindowOpacity(window, opacity)
 
 
 _glfw.glfwIconifyWindow.restype = None
@@ -1508,6 +1594,7 @@ if hasattr(_glfw, 'glfwRequestWindowAttention'):
 
 _glfw.glfwGetWindowMonitor.restype = ctypes.POINTER(_GLFWmonitor)
 _glfw.glfwGetWindowMonitor.argtypes = [ctypes.POINTER(_GLFWwindow)]
+_glfwGetWindowMonitor = _glfw.glfwGetWindowMonitor
 def get_window_monitor(window):
     """
     Returns the monitor that the window uses for full screen mode.
@@ -1515,11 +1602,12 @@ def get_window_monitor(window):
     Wrapper for:
         GLFWmonitor* glfwGetWindowMonitor(GLFWwindow* window);
     """
-    return _glfw.glfwGetWindowMonitor(window)
+    return _glfwGetWindowMonitor(window)
 
 _glfw.glfwGetWindowAttrib.restype = ctypes.c_int
 _glfw.glfwGetWindowAttrib.argtypes = [ctypes.POINTER(_GLFWwindow),
                                       ctypes.c_int]
+_glfwGetWindowAttrib = _glfw.glfwGetWindowAttrib
 def get_window_attrib(window, attrib):
     """
     Returns an attribute of the specified window.
@@ -1527,7 +1615,7 @@ def get_window_attrib(window, attrib):
     Wrapper for:
         int glfwGetWindowAttrib(GLFWwindow* window, int attrib);
     """
-    return _glfw.glfwGetWindowAttrib(window, attrib)
+    return _glfwGetWindowAttrib(window, attrib)
 
 
 if hasattr(_glfw, 'glfwSetWindowAttrib'):
@@ -1565,13 +1653,13 @@ def set_window_user_pointer(window, pointer):
         # Create a void pointer for the python object
         pointer = ctypes.cast(ctypes.pointer(ctypes.py_object(pointer)), ctypes.c_void_p)
 
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
+    window_addr = _handle_addr(window)
     _window_user_data_repository[window_addr] = data
     _glfw.glfwSetWindowUserPointer(window, pointer)
 
 _glfw.glfwGetWindowUserPointer.restype = ctypes.c_void_p
 _glfw.glfwGetWindowUserPointer.argtypes = [ctypes.POINTER(_GLFWwindow)]
+_glfwGetWindowUserPointer = _glfw.glfwGetWindowUserPointer
 def get_window_user_pointer(window):
     """
     Returns the user pointer of the specified window.
@@ -1580,15 +1668,12 @@ def get_window_user_pointer(window):
         void* glfwGetWindowUserPointer(GLFWwindow* window);
     """
 
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
+    window_addr = _handle_addr(window)
 
-    if window_addr in _window_user_data_repository:
-        data = _window_user_data_repository[window_addr]
-        is_wrapped_py_object = data[0]
-        if is_wrapped_py_object:
-            return data[1]
-    return _glfw.glfwGetWindowUserPointer(window)
+    data = _window_user_data_repository.get(window_addr)
+    if data is not None and data[0]:
+        return data[1]
+    return _glfwGetWindowUserPointer(window)
 
 _window_pos_callback_repository = {}
 _callback_repositories.append(_window_pos_callback_repository)
@@ -1602,20 +1687,10 @@ def set_window_pos_callback(window, cbfun):
     Wrapper for:
         GLFWwindowposfun glfwSetWindowPosCallback(GLFWwindow* window, GLFWwindowposfun cbfun);
     """
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
-    if window_addr in _window_pos_callback_repository:
-        previous_callback = _window_pos_callback_repository[window_addr]
-    else:
-        previous_callback = None
-    if cbfun is None:
-        cbfun = 0
-    c_cbfun = _GLFWwindowposfun(cbfun)
-    _window_pos_callback_repository[window_addr] = (cbfun, c_cbfun)
-    cbfun = c_cbfun
-    _glfw.glfwSetWindowPosCallback(window, cbfun)
-    if previous_callback is not None and previous_callback[0] != 0:
-        return previous_callback[0]
+    return _set_window_callback(window, cbfun,
+                                _window_pos_callback_repository,
+                                _GLFWwindowposfun,
+                                _glfw.glfwSetWindowPosCallback)
 
 _window_size_callback_repository = {}
 _callback_repositories.append(_window_size_callback_repository)
@@ -1629,20 +1704,10 @@ def set_window_size_callback(window, cbfun):
     Wrapper for:
         GLFWwindowsizefun glfwSetWindowSizeCallback(GLFWwindow* window, GLFWwindowsizefun cbfun);
     """
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
-    if window_addr in _window_size_callback_repository:
-        previous_callback = _window_size_callback_repository[window_addr]
-    else:
-        previous_callback = None
-    if cbfun is None:
-        cbfun = 0
-    c_cbfun = _GLFWwindowsizefun(cbfun)
-    _window_size_callback_repository[window_addr] = (cbfun, c_cbfun)
-    cbfun = c_cbfun
-    _glfw.glfwSetWindowSizeCallback(window, cbfun)
-    if previous_callback is not None and previous_callback[0] != 0:
-        return previous_callback[0]
+    return _set_window_callback(window, cbfun,
+                                _window_size_callback_repository,
+                                _GLFWwindowsizefun,
+                                _glfw.glfwSetWindowSizeCallback)
 
 _window_close_callback_repository = {}
 _callback_repositories.append(_window_close_callback_repository)
@@ -1656,20 +1721,10 @@ def set_window_close_callback(window, cbfun):
     Wrapper for:
         GLFWwindowclosefun glfwSetWindowCloseCallback(GLFWwindow* window, GLFWwindowclosefun cbfun);
     """
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
-    if window_addr in _window_close_callback_repository:
-        previous_callback = _window_close_callback_repository[window_addr]
-    else:
-        previous_callback = None
-    if cbfun is None:
-        cbfun = 0
-    c_cbfun = _GLFWwindowclosefun(cbfun)
-    _window_close_callback_repository[window_addr] = (cbfun, c_cbfun)
-    cbfun = c_cbfun
-    _glfw.glfwSetWindowCloseCallback(window, cbfun)
-    if previous_callback is not None and previous_callback[0] != 0:
-        return previous_callback[0]
+    return _set_window_callback(window, cbfun,
+                                _window_close_callback_repository,
+                                _GLFWwindowclosefun,
+                                _glfw.glfwSetWindowCloseCallback)
 
 _window_refresh_callback_repository = {}
 _callback_repositories.append(_window_refresh_callback_repository)
@@ -1683,20 +1738,10 @@ def set_window_refresh_callback(window, cbfun):
     Wrapper for:
         GLFWwindowrefreshfun glfwSetWindowRefreshCallback(GLFWwindow* window, GLFWwindowrefreshfun cbfun);
     """
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
-    if window_addr in _window_refresh_callback_repository:
-        previous_callback = _window_refresh_callback_repository[window_addr]
-    else:
-        previous_callback = None
-    if cbfun is None:
-        cbfun = 0
-    c_cbfun = _GLFWwindowrefreshfun(cbfun)
-    _window_refresh_callback_repository[window_addr] = (cbfun, c_cbfun)
-    cbfun = c_cbfun
-    _glfw.glfwSetWindowRefreshCallback(window, cbfun)
-    if previous_callback is not None and previous_callback[0] != 0:
-        return previous_callback[0]
+    return _set_window_callback(window, cbfun,
+                                _window_refresh_callback_repository,
+                                _GLFWwindowrefreshfun,
+                                _glfw.glfwSetWindowRefreshCallback)
 
 _window_focus_callback_repository = {}
 _callback_repositories.append(_window_focus_callback_repository)
@@ -1710,20 +1755,10 @@ def set_window_focus_callback(window, cbfun):
     Wrapper for:
         GLFWwindowfocusfun glfwSetWindowFocusCallback(GLFWwindow* window, GLFWwindowfocusfun cbfun);
     """
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
-    if window_addr in _window_focus_callback_repository:
-        previous_callback = _window_focus_callback_repository[window_addr]
-    else:
-        previous_callback = None
-    if cbfun is None:
-        cbfun = 0
-    c_cbfun = _GLFWwindowfocusfun(cbfun)
-    _window_focus_callback_repository[window_addr] = (cbfun, c_cbfun)
-    cbfun = c_cbfun
-    _glfw.glfwSetWindowFocusCallback(window, cbfun)
-    if previous_callback is not None and previous_callback[0] != 0:
-        return previous_callback[0]
+    return _set_window_callback(window, cbfun,
+                                _window_focus_callback_repository,
+                                _GLFWwindowfocusfun,
+                                _glfw.glfwSetWindowFocusCallback)
 
 _window_iconify_callback_repository = {}
 _callback_repositories.append(_window_iconify_callback_repository)
@@ -1737,20 +1772,10 @@ def set_window_iconify_callback(window, cbfun):
     Wrapper for:
         GLFWwindowiconifyfun glfwSetWindowIconifyCallback(GLFWwindow* window, GLFWwindowiconifyfun cbfun);
     """
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
-    if window_addr in _window_iconify_callback_repository:
-        previous_callback = _window_iconify_callback_repository[window_addr]
-    else:
-        previous_callback = None
-    if cbfun is None:
-        cbfun = 0
-    c_cbfun = _GLFWwindowiconifyfun(cbfun)
-    _window_iconify_callback_repository[window_addr] = (cbfun, c_cbfun)
-    cbfun = c_cbfun
-    _glfw.glfwSetWindowIconifyCallback(window, cbfun)
-    if previous_callback is not None and previous_callback[0] != 0:
-        return previous_callback[0]
+    return _set_window_callback(window, cbfun,
+                                _window_iconify_callback_repository,
+                                _GLFWwindowiconifyfun,
+                                _glfw.glfwSetWindowIconifyCallback)
 
 
 if hasattr(_glfw, 'glfwSetWindowMaximizeCallback'):
@@ -1768,21 +1793,10 @@ if hasattr(_glfw, 'glfwSetWindowMaximizeCallback'):
         Wrapper for:
             GLFWwindowmaximizefun glfwSetWindowMaximizeCallback(GLFWwindow* window, GLFWwindowmaximizefun cbfun);
         """
-        window_addr = ctypes.cast(ctypes.pointer(window),
-                                  ctypes.POINTER(ctypes.c_long)).contents.value
-        if window_addr in _window_maximize_callback_repository:
-            previous_callback = _window_maximize_callback_repository[
-                window_addr]
-        else:
-            previous_callback = None
-        if cbfun is None:
-            cbfun = 0
-        c_cbfun = _GLFWwindowmaximizefun(cbfun)
-        _window_maximize_callback_repository[window_addr] = (cbfun, c_cbfun)
-        cbfun = c_cbfun
-        _glfw.glfwSetWindowMaximizeCallback(window, cbfun)
-        if previous_callback is not None and previous_callback[0] != 0:
-            return previous_callback[0]
+        return _set_window_callback(window, cbfun,
+                                    _window_maximize_callback_repository,
+                                    _GLFWwindowmaximizefun,
+                                    _glfw.glfwSetWindowMaximizeCallback)
 
 
 _framebuffer_size_callback_repository = {}
@@ -1797,20 +1811,10 @@ def set_framebuffer_size_callback(window, cbfun):
     Wrapper for:
         GLFWframebuffersizefun glfwSetFramebufferSizeCallback(GLFWwindow* window, GLFWframebuffersizefun cbfun);
     """
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
-    if window_addr in _framebuffer_size_callback_repository:
-        previous_callback = _framebuffer_size_callback_repository[window_addr]
-    else:
-        previous_callback = None
-    if cbfun is None:
-        cbfun = 0
-    c_cbfun = _GLFWframebuffersizefun(cbfun)
-    _framebuffer_size_callback_repository[window_addr] = (cbfun, c_cbfun)
-    cbfun = c_cbfun
-    _glfw.glfwSetFramebufferSizeCallback(window, cbfun)
-    if previous_callback is not None and previous_callback[0] != 0:
-        return previous_callback[0]
+    return _set_window_callback(window, cbfun,
+                                _framebuffer_size_callback_repository,
+                                _GLFWframebuffersizefun,
+                                _glfw.glfwSetFramebufferSizeCallback)
 
 
 if hasattr(_glfw, 'glfwSetWindowContentScaleCallback'):
@@ -1829,25 +1833,15 @@ if hasattr(_glfw, 'glfwSetWindowContentScaleCallback'):
         Wrapper for:
             GLFWwindowcontentscalefun glfwSetWindowContentScaleCallback(GLFWwindow* window, GLFWwindowcontentscalefun cbfun);
         """
-        window_addr = ctypes.cast(ctypes.pointer(window),
-                                  ctypes.POINTER(ctypes.c_long)).contents.value
-        if window_addr in _window_content_scale_callback_repository:
-            previous_callback = _window_content_scale_callback_repository[
-                window_addr]
-        else:
-            previous_callback = None
-        if cbfun is None:
-            cbfun = 0
-        c_cbfun = _GLFWwindowcontentscalefun(cbfun)
-        _window_content_scale_callback_repository[window_addr] = (cbfun, c_cbfun)
-        cbfun = c_cbfun
-        _glfw.glfwSetWindowContentScaleCallback(window, cbfun)
-        if previous_callback is not None and previous_callback[0] != 0:
-            return previous_callback[0]
+        return _set_window_callback(window, cbfun,
+                                    _window_content_scale_callback_repository,
+                                    _GLFWwindowcontentscalefun,
+                                    _glfw.glfwSetWindowContentScaleCallback)
 
 
 _glfw.glfwPollEvents.restype = None
 _glfw.glfwPollEvents.argtypes = []
+_glfwPollEvents = _glfw.glfwPollEvents
 def poll_events():
     """
     Processes all pending events.
@@ -1855,10 +1849,11 @@ def poll_events():
     Wrapper for:
         void glfwPollEvents(void);
     """
-    _glfw.glfwPollEvents()
+    _glfwPollEvents()
 
 _glfw.glfwWaitEvents.restype = None
 _glfw.glfwWaitEvents.argtypes = []
+_glfwWaitEvents = _glfw.glfwWaitEvents
 def wait_events():
     """
     Waits until events are pending and processes them.
@@ -1866,11 +1861,12 @@ def wait_events():
     Wrapper for:
         void glfwWaitEvents(void);
     """
-    _glfw.glfwWaitEvents()
+    _glfwWaitEvents()
 
 _glfw.glfwGetInputMode.restype = ctypes.c_int
 _glfw.glfwGetInputMode.argtypes = [ctypes.POINTER(_GLFWwindow),
                                    ctypes.c_int]
+_glfwGetInputMode = _glfw.glfwGetInputMode
 def get_input_mode(window, mode):
     """
     Returns the value of an input option for the specified window.
@@ -1878,12 +1874,13 @@ def get_input_mode(window, mode):
     Wrapper for:
         int glfwGetInputMode(GLFWwindow* window, int mode);
     """
-    return _glfw.glfwGetInputMode(window, mode)
+    return _glfwGetInputMode(window, mode)
 
 _glfw.glfwSetInputMode.restype = None
 _glfw.glfwSetInputMode.argtypes = [ctypes.POINTER(_GLFWwindow),
                                    ctypes.c_int,
                                    ctypes.c_int]
+_glfwSetInputMode = _glfw.glfwSetInputMode
 def set_input_mode(window, mode, value):
     """
     Sets an input option for the specified window.
@@ -1895,7 +1892,7 @@ def set_input_mode(window, mode, value):
     Wrapper for:
         void glfwSetInputMode(GLFWwindow* window, int mode, int value);
     """
-    _glfw.glfwSetInputMode(window, mode, value)
+    _glfwSetInputMode(window, mode, value)
 
 
 if hasattr(_glfw, 'glfwRawMouseMotionSupported'):
@@ -1914,6 +1911,7 @@ if hasattr(_glfw, 'glfwRawMouseMotionSupported'):
 _glfw.glfwGetKey.restype = ctypes.c_int
 _glfw.glfwGetKey.argtypes = [ctypes.POINTER(_GLFWwindow),
                              ctypes.c_int]
+_glfwGetKey = _glfw.glfwGetKey
 def get_key(window, key):
     """
     Returns the last reported state of a keyboard key for the specified
@@ -1922,11 +1920,12 @@ def get_key(window, key):
     Wrapper for:
         int glfwGetKey(GLFWwindow* window, int key);
     """
-    return _glfw.glfwGetKey(window, key)
+    return _glfwGetKey(window, key)
 
 _glfw.glfwGetMouseButton.restype = ctypes.c_int
 _glfw.glfwGetMouseButton.argtypes = [ctypes.POINTER(_GLFWwindow),
                                      ctypes.c_int]
+_glfwGetMouseButton = _glfw.glfwGetMouseButton
 def get_mouse_button(window, button):
     """
     Returns the last reported state of a mouse button for the specified
@@ -1935,12 +1934,13 @@ def get_mouse_button(window, button):
     Wrapper for:
         int glfwGetMouseButton(GLFWwindow* window, int button);
     """
-    return _glfw.glfwGetMouseButton(window, button)
+    return _glfwGetMouseButton(window, button)
 
 _glfw.glfwGetCursorPos.restype = None
 _glfw.glfwGetCursorPos.argtypes = [ctypes.POINTER(_GLFWwindow),
                                    ctypes.POINTER(ctypes.c_double),
                                    ctypes.POINTER(ctypes.c_double)]
+_glfwGetCursorPos = _glfw.glfwGetCursorPos
 def get_cursor_pos(window):
     """
     Retrieves the last reported cursor position, relative to the client
@@ -1949,17 +1949,16 @@ def get_cursor_pos(window):
     Wrapper for:
         void glfwGetCursorPos(GLFWwindow* window, double* xpos, double* ypos);
     """
-    xpos_value = ctypes.c_double(0.0)
-    xpos = ctypes.pointer(xpos_value)
-    ypos_value = ctypes.c_double(0.0)
-    ypos = ctypes.pointer(ypos_value)
-    _glfw.glfwGetCursorPos(window, xpos, ypos)
-    return xpos_value.value, ypos_value.value
+    xpos = _c_double(0.0)
+    ypos = _c_double(0.0)
+    _glfwGetCursorPos(window, _byref(xpos), _byref(ypos))
+    return xpos.value, ypos.value
 
 _glfw.glfwSetCursorPos.restype = None
 _glfw.glfwSetCursorPos.argtypes = [ctypes.POINTER(_GLFWwindow),
                                    ctypes.c_double,
                                    ctypes.c_double]
+_glfwSetCursorPos = _glfw.glfwSetCursorPos
 def set_cursor_pos(window, xpos, ypos):
     """
     Sets the position of the cursor, relative to the client area of the window.
@@ -1967,7 +1966,7 @@ def set_cursor_pos(window, xpos, ypos):
     Wrapper for:
         void glfwSetCursorPos(GLFWwindow* window, double xpos, double ypos);
     """
-    _glfw.glfwSetCursorPos(window, xpos, ypos)
+    _glfwSetCursorPos(window, xpos, ypos)
 
 _key_callback_repository = {}
 _callback_repositories.append(_key_callback_repository)
@@ -1981,20 +1980,10 @@ def set_key_callback(window, cbfun):
     Wrapper for:
         GLFWkeyfun glfwSetKeyCallback(GLFWwindow* window, GLFWkeyfun cbfun);
     """
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
-    if window_addr in _key_callback_repository:
-        previous_callback = _key_callback_repository[window_addr]
-    else:
-        previous_callback = None
-    if cbfun is None:
-        cbfun = 0
-    c_cbfun = _GLFWkeyfun(cbfun)
-    _key_callback_repository[window_addr] = (cbfun, c_cbfun)
-    cbfun = c_cbfun
-    _glfw.glfwSetKeyCallback(window, cbfun)
-    if previous_callback is not None and previous_callback[0] != 0:
-        return previous_callback[0]
+    return _set_window_callback(window, cbfun,
+                                _key_callback_repository,
+                                _GLFWkeyfun,
+                                _glfw.glfwSetKeyCallback)
 
 _char_callback_repository = {}
 _callback_repositories.append(_char_callback_repository)
@@ -2008,20 +1997,10 @@ def set_char_callback(window, cbfun):
     Wrapper for:
         GLFWcharfun glfwSetCharCallback(GLFWwindow* window, GLFWcharfun cbfun);
     """
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
-    if window_addr in _char_callback_repository:
-        previous_callback = _char_callback_repository[window_addr]
-    else:
-        previous_callback = None
-    if cbfun is None:
-        cbfun = 0
-    c_cbfun = _GLFWcharfun(cbfun)
-    _char_callback_repository[window_addr] = (cbfun, c_cbfun)
-    cbfun = c_cbfun
-    _glfw.glfwSetCharCallback(window, cbfun)
-    if previous_callback is not None and previous_callback[0] != 0:
-        return previous_callback[0]
+    return _set_window_callback(window, cbfun,
+                                _char_callback_repository,
+                                _GLFWcharfun,
+                                _glfw.glfwSetCharCallback)
 
 _mouse_button_callback_repository = {}
 _callback_repositories.append(_mouse_button_callback_repository)
@@ -2035,20 +2014,10 @@ def set_mouse_button_callback(window, cbfun):
     Wrapper for:
         GLFWmousebuttonfun glfwSetMouseButtonCallback(GLFWwindow* window, GLFWmousebuttonfun cbfun);
     """
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
-    if window_addr in _mouse_button_callback_repository:
-        previous_callback = _mouse_button_callback_repository[window_addr]
-    else:
-        previous_callback = None
-    if cbfun is None:
-        cbfun = 0
-    c_cbfun = _GLFWmousebuttonfun(cbfun)
-    _mouse_button_callback_repository[window_addr] = (cbfun, c_cbfun)
-    cbfun = c_cbfun
-    _glfw.glfwSetMouseButtonCallback(window, cbfun)
-    if previous_callback is not None and previous_callback[0] != 0:
-        return previous_callback[0]
+    return _set_window_callback(window, cbfun,
+                                _mouse_button_callback_repository,
+                                _GLFWmousebuttonfun,
+                                _glfw.glfwSetMouseButtonCallback)
 
 _cursor_pos_callback_repository = {}
 _callback_repositories.append(_cursor_pos_callback_repository)
@@ -2062,20 +2031,10 @@ def set_cursor_pos_callback(window, cbfun):
     Wrapper for:
         GLFWcursorposfun glfwSetCursorPosCallback(GLFWwindow* window, GLFWcursorposfun cbfun);
     """
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
-    if window_addr in _cursor_pos_callback_repository:
-        previous_callback = _cursor_pos_callback_repository[window_addr]
-    else:
-        previous_callback = None
-    if cbfun is None:
-        cbfun = 0
-    c_cbfun = _GLFWcursorposfun(cbfun)
-    _cursor_pos_callback_repository[window_addr] = (cbfun, c_cbfun)
-    cbfun = c_cbfun
-    _glfw.glfwSetCursorPosCallback(window, cbfun)
-    if previous_callback is not None and previous_callback[0] != 0:
-        return previous_callback[0]
+    return _set_window_callback(window, cbfun,
+                                _cursor_pos_callback_repository,
+                                _GLFWcursorposfun,
+                                _glfw.glfwSetCursorPosCallback)
 
 _cursor_enter_callback_repository = {}
 _callback_repositories.append(_cursor_enter_callback_repository)
@@ -2089,20 +2048,10 @@ def set_cursor_enter_callback(window, cbfun):
     Wrapper for:
         GLFWcursorenterfun glfwSetCursorEnterCallback(GLFWwindow* window, GLFWcursorenterfun cbfun);
     """
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
-    if window_addr in _cursor_enter_callback_repository:
-        previous_callback = _cursor_enter_callback_repository[window_addr]
-    else:
-        previous_callback = None
-    if cbfun is None:
-        cbfun = 0
-    c_cbfun = _GLFWcursorenterfun(cbfun)
-    _cursor_enter_callback_repository[window_addr] = (cbfun, c_cbfun)
-    cbfun = c_cbfun
-    _glfw.glfwSetCursorEnterCallback(window, cbfun)
-    if previous_callback is not None and previous_callback[0] != 0:
-        return previous_callback[0]
+    return _set_window_callback(window, cbfun,
+                                _cursor_enter_callback_repository,
+                                _GLFWcursorenterfun,
+                                _glfw.glfwSetCursorEnterCallback)
 
 _scroll_callback_repository = {}
 _callback_repositories.append(_scroll_callback_repository)
@@ -2116,23 +2065,14 @@ def set_scroll_callback(window, cbfun):
     Wrapper for:
         GLFWscrollfun glfwSetScrollCallback(GLFWwindow* window, GLFWscrollfun cbfun);
     """
-    window_addr = ctypes.cast(ctypes.pointer(window),
-                              ctypes.POINTER(ctypes.c_long)).contents.value
-    if window_addr in _scroll_callback_repository:
-        previous_callback = _scroll_callback_repository[window_addr]
-    else:
-        previous_callback = None
-    if cbfun is None:
-        cbfun = 0
-    c_cbfun = _GLFWscrollfun(cbfun)
-    _scroll_callback_repository[window_addr] = (cbfun, c_cbfun)
-    cbfun = c_cbfun
-    _glfw.glfwSetScrollCallback(window, cbfun)
-    if previous_callback is not None and previous_callback[0] != 0:
-        return previous_callback[0]
+    return _set_window_callback(window, cbfun,
+                                _scroll_callback_repository,
+                                _GLFWscrollfun,
+                                _glfw.glfwSetScrollCallback)
 
 _glfw.glfwJoystickPresent.restype = ctypes.c_int
 _glfw.glfwJoystickPresent.argtypes = [ctypes.c_int]
+_glfwJoystickPresent = _glfw.glfwJoystickPresent
 def joystick_present(joy):
     """
     Returns whether the specified joystick is present.
@@ -2140,11 +2080,12 @@ def joystick_present(joy):
     Wrapper for:
         int glfwJoystickPresent(int joy);
     """
-    return _glfw.glfwJoystickPresent(joy)
+    return _glfwJoystickPresent(joy)
 
 _glfw.glfwGetJoystickAxes.restype = ctypes.POINTER(ctypes.c_float)
 _glfw.glfwGetJoystickAxes.argtypes = [ctypes.c_int,
                                       ctypes.POINTER(ctypes.c_int)]
+_glfwGetJoystickAxes = _glfw.glfwGetJoystickAxes
 def get_joystick_axes(joy):
     """
     Returns the values of all axes of the specified joystick.
@@ -2152,14 +2093,14 @@ def get_joystick_axes(joy):
     Wrapper for:
         const float* glfwGetJoystickAxes(int joy, int* count);
     """
-    count_value = ctypes.c_int(0)
-    count = ctypes.pointer(count_value)
-    result = _glfw.glfwGetJoystickAxes(joy, count)
-    return result, count_value.value
+    count = _c_int(0)
+    result = _glfwGetJoystickAxes(joy, _byref(count))
+    return result, count.value
 
 _glfw.glfwGetJoystickButtons.restype = ctypes.POINTER(ctypes.c_ubyte)
 _glfw.glfwGetJoystickButtons.argtypes = [ctypes.c_int,
                                          ctypes.POINTER(ctypes.c_int)]
+_glfwGetJoystickButtons = _glfw.glfwGetJoystickButtons
 def get_joystick_buttons(joy):
     """
     Returns the state of all buttons of the specified joystick.
@@ -2167,16 +2108,16 @@ def get_joystick_buttons(joy):
     Wrapper for:
         const unsigned char* glfwGetJoystickButtons(int joy, int* count);
     """
-    count_value = ctypes.c_int(0)
-    count = ctypes.pointer(count_value)
-    result = _glfw.glfwGetJoystickButtons(joy, count)
-    return result, count_value.value
+    count = _c_int(0)
+    result = _glfwGetJoystickButtons(joy, _byref(count))
+    return result, count.value
 
 
 if hasattr(_glfw, 'glfwGetJoystickHats'):
     _glfw.glfwGetJoystickHats.restype = ctypes.POINTER(ctypes.c_ubyte)
     _glfw.glfwGetJoystickHats.argtypes = [ctypes.c_int,
                                              ctypes.POINTER(ctypes.c_int)]
+    _glfwGetJoystickHats = _glfw.glfwGetJoystickHats
     def get_joystick_hats(joystick_id):
         """
         Returns the state of all hats of the specified joystick.
@@ -2184,10 +2125,9 @@ if hasattr(_glfw, 'glfwGetJoystickHats'):
         Wrapper for:
             const unsigned char* glfwGetJoystickButtons(int joy, int* count);
         """
-        count_value = ctypes.c_int(0)
-        count = ctypes.pointer(count_value)
-        result = _glfw.glfwGetJoystickHats(joystick_id, count)
-        return result, count_value.value
+        count = _c_int(0)
+        result = _glfwGetJoystickHats(joystick_id, _byref(count))
+        return result, count.value
 
 
 _glfw.glfwGetJoystickName.restype = ctypes.c_char_p
@@ -2214,8 +2154,8 @@ if hasattr(_glfw, 'glfwGetJoystickGUID'):
         """
         return _glfw.glfwGetJoystickGUID(joystick_id)
 
+_joystick_user_data_repository = {}
 if hasattr(_glfw, 'glfwSetJoystickUserPointer') and hasattr(_glfw, 'glfwGetJoystickUserPointer'):
-    _joystick_user_data_repository = {}
     _glfw.glfwSetJoystickUserPointer.restype = None
     _glfw.glfwSetJoystickUserPointer.argtypes = [ctypes.c_int,
                                                ctypes.c_void_p]
@@ -2235,12 +2175,12 @@ if hasattr(_glfw, 'glfwSetJoystickUserPointer') and hasattr(_glfw, 'glfwGetJoyst
         data = (False, pointer)
         if not isinstance(pointer, ctypes.c_void_p):
             data = (True, pointer)
-            # Create a void pointer for the python object
-            pointer = ctypes.cast(ctypes.pointer(ctypes.py_object(pointer)),
-                                  ctypes.c_void_p)
+            # python objects are only returned from the repository, so GLFW
+            # does not need a pointer to them
+            pointer = None
 
         _joystick_user_data_repository[joystick_id] = data
-        _glfw.glfwSetWindowUserPointer(joystick_id, pointer)
+        _glfw.glfwSetJoystickUserPointer(joystick_id, pointer)
 
 
     _glfw.glfwGetJoystickUserPointer.restype = ctypes.c_void_p
@@ -2280,6 +2220,7 @@ if hasattr(_glfw, 'glfwGetGamepadState'):
     _glfw.glfwGetGamepadState.restype = ctypes.c_int
     _glfw.glfwGetGamepadState.argtypes = [ctypes.c_int,
                                           ctypes.POINTER(_GLFWgamepadstate)]
+    _glfwGetGamepadState = _glfw.glfwGetGamepadState
     def get_gamepad_state(joystick_id):
         """
         Retrieves the state of the specified joystick remapped as a gamepad.
@@ -2288,7 +2229,7 @@ if hasattr(_glfw, 'glfwGetGamepadState'):
             int glfwGetGamepadState(int jid, GLFWgamepadstate* state);
         """
         gamepad_state = _GLFWgamepadstate()
-        if _glfw.glfwGetGamepadState(joystick_id, ctypes.byref(gamepad_state)) == FALSE:
+        if _glfwGetGamepadState(joystick_id, ctypes.byref(gamepad_state)) == FALSE:
             return None
         return gamepad_state.unwrap()
 
@@ -2305,7 +2246,9 @@ def set_clipboard_string(window, string):
     """
     if window is not None:
         warnings.warn("The window parameter to glfwSetClipboardString is deprecated", DeprecationWarning, stacklevel=2)
-    _glfw.glfwSetClipboardString(window, _to_char_p(string))
+    if isinstance(string, str):
+        string = string.encode('utf-8')
+    _glfw.glfwSetClipboardString(window, string)
 
 _glfw.glfwGetClipboardString.restype = ctypes.c_char_p
 _glfw.glfwGetClipboardString.argtypes = [ctypes.POINTER(_GLFWwindow)]
@@ -2322,6 +2265,7 @@ def get_clipboard_string(window):
 
 _glfw.glfwGetTime.restype = ctypes.c_double
 _glfw.glfwGetTime.argtypes = []
+_glfwGetTime = _glfw.glfwGetTime
 def get_time():
     """
     Returns the value of the GLFW timer.
@@ -2329,10 +2273,11 @@ def get_time():
     Wrapper for:
         double glfwGetTime(void);
     """
-    return _glfw.glfwGetTime()
+    return _glfwGetTime()
 
 _glfw.glfwSetTime.restype = None
 _glfw.glfwSetTime.argtypes = [ctypes.c_double]
+_glfwSetTime = _glfw.glfwSetTime
 def set_time(time):
     """
     Sets the GLFW timer.
@@ -2340,7 +2285,7 @@ def set_time(time):
     Wrapper for:
         void glfwSetTime(double time);
     """
-    _glfw.glfwSetTime(time)
+    _glfwSetTime(time)
 
 _glfw.glfwMakeContextCurrent.restype = None
 _glfw.glfwMakeContextCurrent.argtypes = [ctypes.POINTER(_GLFWwindow)]
@@ -2367,6 +2312,7 @@ def get_current_context():
 
 _glfw.glfwSwapBuffers.restype = None
 _glfw.glfwSwapBuffers.argtypes = [ctypes.POINTER(_GLFWwindow)]
+_glfwSwapBuffers = _glfw.glfwSwapBuffers
 def swap_buffers(window):
     """
     Swaps the front and back buffers of the specified window.
@@ -2374,10 +2320,11 @@ def swap_buffers(window):
     Wrapper for:
         void glfwSwapBuffers(GLFWwindow* window);
     """
-    _glfw.glfwSwapBuffers(window)
+    _glfwSwapBuffers(window)
 
 _glfw.glfwSwapInterval.restype = None
 _glfw.glfwSwapInterval.argtypes = [ctypes.c_int]
+_glfwSwapInterval = _glfw.glfwSwapInterval
 def swap_interval(interval):
     """
     Sets the swap interval for the current context.
@@ -2385,10 +2332,13 @@ def swap_interval(interval):
     Wrapper for:
         void glfwSwapInterval(int interval);
     """
-    _glfw.glfwSwapInterval(interval)
+    _glfwSwapInterval(interval)
 
 _glfw.glfwExtensionSupported.restype = ctypes.c_int
 _glfw.glfwExtensionSupported.argtypes = [ctypes.c_char_p]
+# Maps extension names to their UTF-8 encoding, as loaders check the same
+# names repeatedly, e.g. for every context.
+_encoded_extension_names = {}
 def extension_supported(extension):
     """
     Returns whether the specified extension is available.
@@ -2396,10 +2346,20 @@ def extension_supported(extension):
     Wrapper for:
         int glfwExtensionSupported(const char* extension);
     """
-    return _glfw.glfwExtensionSupported(_to_char_p(extension))
+    if isinstance(extension, str):
+        encoded_extension = _encoded_extension_names.get(extension)
+        if encoded_extension is None:
+            encoded_extension = extension.encode('utf-8')
+            _encoded_extension_names[extension] = encoded_extension
+        extension = encoded_extension
+    return _glfw.glfwExtensionSupported(extension)
 
 _glfw.glfwGetProcAddress.restype = ctypes.c_void_p
 _glfw.glfwGetProcAddress.argtypes = [ctypes.c_char_p]
+_glfwGetProcAddress = _glfw.glfwGetProcAddress
+# Maps function names to their UTF-8 encoding, as loaders request the same
+# functions repeatedly, e.g. for every context.
+_encoded_proc_names = {}
 def get_proc_address(procname):
     """
     Returns the address of the specified function for the current
@@ -2408,7 +2368,13 @@ def get_proc_address(procname):
     Wrapper for:
         GLFWglproc glfwGetProcAddress(const char* procname);
     """
-    return _glfw.glfwGetProcAddress(_to_char_p(procname))
+    if isinstance(procname, str):
+        encoded_procname = _encoded_proc_names.get(procname)
+        if encoded_procname is None:
+            encoded_procname = procname.encode('utf-8')
+            _encoded_proc_names[procname] = encoded_procname
+        procname = encoded_procname
+    return _glfwGetProcAddress(procname)
 
 if hasattr(_glfw, 'glfwSetDropCallback'):
     _window_drop_callback_repository = {}
@@ -2416,6 +2382,18 @@ if hasattr(_glfw, 'glfwSetDropCallback'):
     _glfw.glfwSetDropCallback.restype = _GLFWdropfun
     _glfw.glfwSetDropCallback.argtypes = [ctypes.POINTER(_GLFWwindow),
                                           _GLFWdropfun]
+    def _drop_cfunctype(cbfun):
+        """
+        Creates the function pointer for a drop callback, which is called with
+        a list of the dropped paths.
+        """
+        if cbfun == 0:
+            return _GLFWdropfun(0)
+        def cb_wrapper(window, count, c_paths):
+            paths = [path.decode('utf-8') for path in c_paths[:count]]
+            cbfun(window, paths)
+        return _GLFWdropfun(cb_wrapper)
+
     def set_drop_callback(window, cbfun):
         """
         Sets the file drop callback.
@@ -2423,25 +2401,10 @@ if hasattr(_glfw, 'glfwSetDropCallback'):
         Wrapper for:
             GLFWdropfun glfwSetDropCallback(GLFWwindow* window, GLFWdropfun cbfun);
         """
-        window_addr = ctypes.cast(ctypes.pointer(window),
-                                  ctypes.POINTER(ctypes.c_long)).contents.value
-        if window_addr in _window_drop_callback_repository:
-            previous_callback = _window_drop_callback_repository[window_addr]
-        else:
-            previous_callback = None
-        if cbfun is None:
-            cbfun = 0
-        else:
-            def cb_wrapper(window, count, c_paths, cbfun=cbfun):
-                paths = [c_paths[i].decode('utf-8') for i in range(count)]
-                cbfun(window, paths)
-            cbfun = cb_wrapper
-        c_cbfun = _GLFWdropfun(cbfun)
-        _window_drop_callback_repository[window_addr] = (cbfun, c_cbfun)
-        cbfun = c_cbfun
-        _glfw.glfwSetDropCallback(window, cbfun)
-        if previous_callback is not None and previous_callback[0] != 0:
-            return previous_callback[0]
+        return _set_window_callback(window, cbfun,
+                                    _window_drop_callback_repository,
+                                    _drop_cfunctype,
+                                    _glfw.glfwSetDropCallback)
 
 if hasattr(_glfw, 'glfwSetCharModsCallback'):
     _window_char_mods_callback_repository = {}
@@ -2457,20 +2420,10 @@ if hasattr(_glfw, 'glfwSetCharModsCallback'):
             GLFWcharmodsfun glfwSetCharModsCallback(GLFWwindow* window, GLFWcharmodsfun cbfun);
         """
         warnings.warn("glfwSetCharModsCallback is scheduled for removal in GLFW 4.0", DeprecationWarning, stacklevel=2)
-        window_addr = ctypes.cast(ctypes.pointer(window),
-                                  ctypes.POINTER(ctypes.c_long)).contents.value
-        if window_addr in _window_char_mods_callback_repository:
-            previous_callback = _window_char_mods_callback_repository[window_addr]
-        else:
-            previous_callback = None
-        if cbfun is None:
-            cbfun = 0
-        c_cbfun = _GLFWcharmodsfun(cbfun)
-        _window_char_mods_callback_repository[window_addr] = (cbfun, c_cbfun)
-        cbfun = c_cbfun
-        _glfw.glfwSetCharModsCallback(window, cbfun)
-        if previous_callback is not None and previous_callback[0] != 0:
-            return previous_callback[0]
+        return _set_window_callback(window, cbfun,
+                                    _window_char_mods_callback_repository,
+                                    _GLFWcharmodsfun,
+                                    _glfw.glfwSetCharModsCallback)
 
 if hasattr(_glfw, 'glfwVulkanSupported'):
     _glfw.glfwVulkanSupported.restype = ctypes.c_int
@@ -2495,10 +2448,9 @@ if hasattr(_glfw, 'glfwGetRequiredInstanceExtensions'):
             const char** glfwGetRequiredInstanceExtensions(uint32_t* count);
         """
         count_value = ctypes.c_uint32(0)
-        count = ctypes.pointer(count_value)
-        c_extensions = _glfw.glfwGetRequiredInstanceExtensions(count)
+        c_extensions = _glfw.glfwGetRequiredInstanceExtensions(ctypes.byref(count_value))
         count = count_value.value
-        extensions = [c_extensions[i].decode('utf-8') for i in range(count)]
+        extensions = [extension.decode('utf-8') for extension in c_extensions[:count]]
         return extensions
 
 if hasattr(_glfw, 'glfwGetTimerValue'):
@@ -2511,7 +2463,7 @@ if hasattr(_glfw, 'glfwGetTimerValue'):
         Wrapper for:
             uint64_t glfwGetTimerValue(void);
         """
-        return int(_glfw.glfwGetTimerValue())
+        return _glfw.glfwGetTimerValue()
 
 if hasattr(_glfw, 'glfwGetTimerFrequency'):
     _glfw.glfwGetTimerFrequency.restype = ctypes.c_uint64
@@ -2523,7 +2475,7 @@ if hasattr(_glfw, 'glfwGetTimerFrequency'):
         Wrapper for:
             uint64_t glfwGetTimerFrequency(void);
         """
-        return int(_glfw.glfwGetTimerFrequency())
+        return _glfw.glfwGetTimerFrequency()
 
 
 if hasattr(_glfw, 'glfwSetJoystickCallback'):
@@ -2532,16 +2484,16 @@ if hasattr(_glfw, 'glfwSetJoystickCallback'):
     _glfw.glfwSetJoystickCallback.argtypes = [_GLFWjoystickfun]
     def set_joystick_callback(cbfun):
         """
-        Sets the error callback.
+        Sets the joystick configuration callback.
 
         Wrapper for:
             GLFWjoystickfun glfwSetJoystickCallback(GLFWjoystickfun cbfun);
         """
         global _joystick_callback
-        previous_callback = _error_callback
+        previous_callback = _joystick_callback
         if cbfun is None:
             cbfun = 0
-        c_cbfun = _GLFWjoystickfun(cbfun)
+        c_cbfun = _get_c_callback(_GLFWjoystickfun, cbfun)
         _joystick_callback = (cbfun, c_cbfun)
         cbfun = c_cbfun
         _glfw.glfwSetJoystickCallback(cbfun)
@@ -2559,7 +2511,9 @@ if hasattr(_glfw, 'glfwUpdateGamepadMappings'):
         Wrapper for:
             int glfwUpdateGamepadMappings(const char* string);
         """
-        return _glfw.glfwUpdateGamepadMappings(_to_char_p(string))
+        if isinstance(string, str):
+            string = string.encode('utf-8')
+        return _glfw.glfwUpdateGamepadMappings(string)
 
 
 if hasattr(_glfw, 'glfwGetGamepadName'):
@@ -2597,6 +2551,7 @@ if hasattr(_glfw, 'glfwGetKeyName'):
 if hasattr(_glfw, 'glfwGetKeyScancode'):
     _glfw.glfwGetKeyScancode.restype = ctypes.c_int
     _glfw.glfwGetKeyScancode.argtypes = [ctypes.c_int]
+    _glfwGetKeyScancode = _glfw.glfwGetKeyScancode
     def get_key_scancode(key):
         """
         Returns the platform-specific scancode of the specified key.
@@ -2604,7 +2559,7 @@ if hasattr(_glfw, 'glfwGetKeyScancode'):
         Wrapper for:
             int glfwGetKeyScancode(int key);
         """
-        return _glfw.glfwGetKeyScancode(key)
+        return _glfwGetKeyScancode(key)
 
 
 if hasattr(_glfw, 'glfwCreateCursor'):
@@ -2621,7 +2576,14 @@ if hasattr(_glfw, 'glfwCreateCursor'):
         """
         c_image = _GLFWimage()
         c_image.wrap(image)
-        return _glfw.glfwCreateCursor(ctypes.pointer(c_image), xhot, yhot)
+        return _glfw.glfwCreateCursor(ctypes.byref(c_image), xhot, yhot)
+
+# Standard cursors are shared between calls of create_standard_cursor with
+# the same shape. This maps each shape to its cursor and the number of times it
+# has been created without being destroyed, and each cursor address to its
+# shape, so that destroy_cursor only destroys it once it is no longer used.
+_standard_cursor_repository = {}
+_standard_cursor_shapes = {}
 
 if hasattr(_glfw, 'glfwCreateStandardCursor'):
     _glfw.glfwCreateStandardCursor.restype = ctypes.POINTER(_GLFWcursor)
@@ -2630,10 +2592,21 @@ if hasattr(_glfw, 'glfwCreateStandardCursor'):
         """
         Creates a cursor with a standard shape.
 
+        Repeated calls with the same shape return the same cursor, until it
+        has been destroyed as often as it was created.
+
         Wrapper for:
             GLFWcursor* glfwCreateStandardCursor(int shape);
         """
-        return _glfw.glfwCreateStandardCursor(shape)
+        standard_cursor = _standard_cursor_repository.get(shape)
+        if standard_cursor is not None:
+            standard_cursor[1] += 1
+            return standard_cursor[0]
+        cursor = _glfw.glfwCreateStandardCursor(shape)
+        if cursor:
+            _standard_cursor_repository[shape] = [cursor, 1]
+            _standard_cursor_shapes[_handle_addr(cursor)] = shape
+        return cursor
 
 if hasattr(_glfw, 'glfwDestroyCursor'):
     _glfw.glfwDestroyCursor.restype = None
@@ -2645,6 +2618,16 @@ if hasattr(_glfw, 'glfwDestroyCursor'):
         Wrapper for:
             void glfwDestroyCursor(GLFWcursor* cursor);
         """
+        if cursor:
+            cursor_addr = _handle_addr(cursor)
+            shape = _standard_cursor_shapes.get(cursor_addr)
+            if shape is not None:
+                standard_cursor = _standard_cursor_repository[shape]
+                standard_cursor[1] -= 1
+                if standard_cursor[1] > 0:
+                    return
+                del _standard_cursor_repository[shape]
+                del _standard_cursor_shapes[cursor_addr]
         _glfw.glfwDestroyCursor(cursor)
 
 if hasattr(_glfw, 'glfwSetCursor'):
@@ -2694,10 +2677,18 @@ if hasattr(_glfw, 'glfwGetPhysicalDevicePresentationSupport'):
         device = _cffi_to_ctypes_void_p(device)
         return _glfw.glfwGetPhysicalDevicePresentationSupport(instance, device, queuefamily)
 
+# Maps the names of Vulkan global commands, which are queried without an
+# instance, to their addresses, as Vulkan loaders query them repeatedly.
+# Functions of an instance are not cached, as a new instance may be created
+# at the address of a destroyed one with other layers enabled. Only functions
+# that were found are cached, and the cache is cleared on terminate as the
+# Vulkan loader may change.
+_instance_proc_address_cache = {}
 if hasattr(_glfw, 'glfwGetInstanceProcAddress'):
     _glfw.glfwGetInstanceProcAddress.restype = ctypes.c_void_p
     _glfw.glfwGetInstanceProcAddress.argtypes = [ctypes.c_void_p,
                                                  ctypes.c_char_p]
+    _glfwGetInstanceProcAddress = _glfw.glfwGetInstanceProcAddress
     def get_instance_proc_address(instance, procname):
         """
         Returns the address of the specified Vulkan instance function.
@@ -2706,13 +2697,33 @@ if hasattr(_glfw, 'glfwGetInstanceProcAddress'):
             GLFWvkproc glfwGetInstanceProcAddress(VkInstance instance, const char* procname);
         """
         instance = _cffi_to_ctypes_void_p(instance)
-        return _glfw.glfwGetInstanceProcAddress(instance, procname)
+        if isinstance(instance, ctypes.c_void_p):
+            instance = instance.value
+        if instance:
+            if isinstance(procname, str):
+                procname = procname.encode('utf-8')
+            return _glfwGetInstanceProcAddress(instance, procname)
+        address = _instance_proc_address_cache.get(procname)
+        if address is not None:
+            return address
+        if isinstance(procname, str):
+            encoded_procname = procname.encode('utf-8')
+        else:
+            encoded_procname = procname
+        address = _glfwGetInstanceProcAddress(None, encoded_procname)
+        if address is not None:
+            _instance_proc_address_cache[procname] = address
+        return address
 
 if hasattr(_glfw, 'glfwSetWindowIcon'):
     _glfw.glfwSetWindowIcon.restype = None
     _glfw.glfwSetWindowIcon.argtypes = [ctypes.POINTER(_GLFWwindow),
                                         ctypes.c_int,
                                         ctypes.POINTER(_GLFWimage)]
+    _glfwSetWindowIcon = _glfw.glfwSetWindowIcon
+
+    # icon array types by image count
+    _icon_array_types = {}
 
     def set_window_icon(window, count, images):
         """
@@ -2721,20 +2732,25 @@ if hasattr(_glfw, 'glfwSetWindowIcon'):
         Wrapper for:
             void glfwSetWindowIcon(GLFWwindow* window, int count, const GLFWimage* images);
         """
-        if count == 1 and (not hasattr(images, '__len__') or len(images) == 3):
-            # Stay compatible to calls passing a single icon
-            images = [images]
-        array_type = _GLFWimage * count
+        if count == 1:
+            images_len = getattr(images, '__len__', None)
+            if images_len is None or images_len() == 3:
+                # Stay compatible to calls passing a single icon
+                images = (images,)
+        array_type = _icon_array_types.get(count)
+        if array_type is None:
+            array_type = _icon_array_types[count] = _GLFWimage * count
         _images = array_type()
-        for i, image in enumerate(images):
-            _images[i].wrap(image)
-        _glfw.glfwSetWindowIcon(window, count, _images)
+        for c_image, image in zip(_images, images):
+            c_image.wrap(image)
+        _glfwSetWindowIcon(window, count, _images)
 
 if hasattr(_glfw, 'glfwSetWindowSizeLimits'):
     _glfw.glfwSetWindowSizeLimits.restype = None
     _glfw.glfwSetWindowSizeLimits.argtypes = [ctypes.POINTER(_GLFWwindow),
                                               ctypes.c_int, ctypes.c_int,
                                               ctypes.c_int, ctypes.c_int]
+    _glfwSetWindowSizeLimits = _glfw.glfwSetWindowSizeLimits
 
     def set_window_size_limits(window,
                                minwidth, minheight,
@@ -2745,14 +2761,15 @@ if hasattr(_glfw, 'glfwSetWindowSizeLimits'):
         Wrapper for:
             void glfwSetWindowSizeLimits(GLFWwindow* window, int minwidth, int minheight, int maxwidth, int maxheight);
         """
-        _glfw.glfwSetWindowSizeLimits(window,
-                                      minwidth, minheight,
-                                      maxwidth, maxheight)
+        _glfwSetWindowSizeLimits(window,
+                                 minwidth, minheight,
+                                 maxwidth, maxheight)
 
 if hasattr(_glfw, 'glfwSetWindowAspectRatio'):
     _glfw.glfwSetWindowAspectRatio.restype = None
     _glfw.glfwSetWindowAspectRatio.argtypes = [ctypes.POINTER(_GLFWwindow),
                                                ctypes.c_int, ctypes.c_int]
+    _glfwSetWindowAspectRatio = _glfw.glfwSetWindowAspectRatio
     def set_window_aspect_ratio(window, numer, denom):
         """
         Sets the aspect ratio of the specified window.
@@ -2760,7 +2777,7 @@ if hasattr(_glfw, 'glfwSetWindowAspectRatio'):
         Wrapper for:
             void glfwSetWindowAspectRatio(GLFWwindow* window, int numer, int denom);
         """
-        _glfw.glfwSetWindowAspectRatio(window, numer, denom)
+        _glfwSetWindowAspectRatio(window, numer, denom)
 
 if hasattr(_glfw, 'glfwGetWindowFrameSize'):
     _glfw.glfwGetWindowFrameSize.restype = None
@@ -2769,6 +2786,7 @@ if hasattr(_glfw, 'glfwGetWindowFrameSize'):
                                              ctypes.POINTER(ctypes.c_int),
                                              ctypes.POINTER(ctypes.c_int),
                                              ctypes.POINTER(ctypes.c_int)]
+    _glfwGetWindowFrameSize = _glfw.glfwGetWindowFrameSize
     def get_window_frame_size(window):
         """
         Retrieves the size of the frame of the window.
@@ -2776,20 +2794,21 @@ if hasattr(_glfw, 'glfwGetWindowFrameSize'):
         Wrapper for:
             void glfwGetWindowFrameSize(GLFWwindow* window, int* left, int* top, int* right, int* bottom);
         """
-        left = ctypes.c_int(0)
-        top = ctypes.c_int(0)
-        right = ctypes.c_int(0)
-        bottom = ctypes.c_int(0)
-        _glfw.glfwGetWindowFrameSize(window,
-                                     ctypes.pointer(left),
-                                     ctypes.pointer(top),
-                                     ctypes.pointer(right),
-                                     ctypes.pointer(bottom))
+        left = _c_int(0)
+        top = _c_int(0)
+        right = _c_int(0)
+        bottom = _c_int(0)
+        _glfwGetWindowFrameSize(window,
+                                _byref(left),
+                                _byref(top),
+                                _byref(right),
+                                _byref(bottom))
         return left.value, top.value, right.value, bottom.value
 
 if hasattr(_glfw, 'glfwMaximizeWindow'):
     _glfw.glfwMaximizeWindow.restype = None
     _glfw.glfwMaximizeWindow.argtypes = [ctypes.POINTER(_GLFWwindow)]
+    _glfwMaximizeWindow = _glfw.glfwMaximizeWindow
     def maximize_window(window):
         """
         Maximizes the specified window.
@@ -2797,11 +2816,12 @@ if hasattr(_glfw, 'glfwMaximizeWindow'):
         Wrapper for:
             void glfwMaximizeWindow(GLFWwindow* window);
         """
-        _glfw.glfwMaximizeWindow(window)
+        _glfwMaximizeWindow(window)
 
 if hasattr(_glfw, 'glfwFocusWindow'):
     _glfw.glfwFocusWindow.restype = None
     _glfw.glfwFocusWindow.argtypes = [ctypes.POINTER(_GLFWwindow)]
+    _glfwFocusWindow = _glfw.glfwFocusWindow
     def focus_window(window):
         """
         Brings the specified window to front and sets input focus.
@@ -2809,7 +2829,7 @@ if hasattr(_glfw, 'glfwFocusWindow'):
         Wrapper for:
             void glfwFocusWindow(GLFWwindow* window);
         """
-        _glfw.glfwFocusWindow(window)
+        _glfwFocusWindow(window)
 
 if hasattr(_glfw, 'glfwSetWindowMonitor'):
     _glfw.glfwSetWindowMonitor.restype = None
@@ -2820,6 +2840,7 @@ if hasattr(_glfw, 'glfwSetWindowMonitor'):
                                            ctypes.c_int,
                                            ctypes.c_int,
                                            ctypes.c_int]
+    _glfwSetWindowMonitor = _glfw.glfwSetWindowMonitor
     def set_window_monitor(window, monitor, xpos, ypos, width, height,
                            refresh_rate):
         """
@@ -2828,12 +2849,13 @@ if hasattr(_glfw, 'glfwSetWindowMonitor'):
         Wrapper for:
             void glfwSetWindowMonitor(GLFWwindow* window, GLFWmonitor* monitor, int xpos, int ypos, int width, int height, int refreshRate);
         """
-        _glfw.glfwSetWindowMonitor(window, monitor,
-                                   xpos, ypos, width, height, refresh_rate)
+        _glfwSetWindowMonitor(window, monitor,
+                              xpos, ypos, width, height, refresh_rate)
 
 if hasattr(_glfw, 'glfwWaitEventsTimeout'):
     _glfw.glfwWaitEventsTimeout.restype = None
     _glfw.glfwWaitEventsTimeout.argtypes = [ctypes.c_double]
+    _glfwWaitEventsTimeout = _glfw.glfwWaitEventsTimeout
     def wait_events_timeout(timeout):
         """
         Waits with timeout until events are queued and processes them.
@@ -2841,11 +2863,12 @@ if hasattr(_glfw, 'glfwWaitEventsTimeout'):
         Wrapper for:
             void glfwWaitEventsTimeout(double timeout);
         """
-        _glfw.glfwWaitEventsTimeout(timeout)
+        _glfwWaitEventsTimeout(timeout)
 
 if hasattr(_glfw, 'glfwPostEmptyEvent'):
     _glfw.glfwPostEmptyEvent.restype = None
     _glfw.glfwPostEmptyEvent.argtypes = []
+    _glfwPostEmptyEvent = _glfw.glfwPostEmptyEvent
     def post_empty_event():
         """
         Posts an empty event to the event queue.
@@ -2853,7 +2876,7 @@ if hasattr(_glfw, 'glfwPostEmptyEvent'):
         Wrapper for:
             void glfwPostEmptyEvent();
         """
-        _glfw.glfwPostEmptyEvent()
+        _glfwPostEmptyEvent()
 
 
 if hasattr(_glfw, 'glfwGetWin32Adapter'):
@@ -3008,6 +3031,7 @@ if hasattr(_glfw, 'glfwGetX11Window'):
 if hasattr(_glfw, 'glfwSetX11SelectionString'):
     _glfw.glfwSetX11SelectionString.restype = None
     _glfw.glfwSetX11SelectionString.argtypes = [ctypes.c_char_p]
+    _glfwSetX11SelectionString = _glfw.glfwSetX11SelectionString
     def set_x11_selection_string(string):
         """
         Sets the current primary selection to the specified string.
@@ -3015,8 +3039,9 @@ if hasattr(_glfw, 'glfwSetX11SelectionString'):
         Wrapper for:
             void glfwSetX11SelectionString(const char* string);
         """
-        binary_string = string.encode('utf-8')
-        _glfw.glfwSetX11SelectionString(binary_string)
+        if isinstance(string, str):
+            string = string.encode('utf-8')
+        _glfwSetX11SelectionString(string)
 
 
 if hasattr(_glfw, 'glfwGetX11SelectionString'):
@@ -3149,15 +3174,15 @@ if hasattr(_glfw, 'glfwGetOSMesaColorBuffer'):
         Wrapper for:
             int glfwGetOSMesaColorBuffer(GLFWwindow* window, int* width, int* height, int* format, void** buffer);
         """
-        width_value = ctypes.c_int(0)
-        width = ctypes.pointer(width_value)
-        height_value = ctypes.c_int(0)
-        height = ctypes.pointer(height_value)
-        format_value = ctypes.c_int(0)
-        format = ctypes.pointer(format_value)
-        buffer_value = ctypes.c_void_p(0)
-        buffer = ctypes.pointer(buffer_value)
-        success = _glfw.glfwGetOSMesaColorBuffer(window, width, height, format, buffer)
+        width = ctypes.c_int(0)
+        height = ctypes.c_int(0)
+        format = ctypes.c_int(0)
+        buffer = ctypes.c_void_p(0)
+        success = _glfw.glfwGetOSMesaColorBuffer(window,
+                                                ctypes.byref(width),
+                                                ctypes.byref(height),
+                                                ctypes.byref(format),
+                                                ctypes.byref(buffer))
         if not success:
             return None
         return width.value, height.value, format.value, buffer.value
@@ -3173,15 +3198,15 @@ if hasattr(_glfw, 'glfwGetOSMesaDepthBuffer'):
         Wrapper for:
             int glfwGetOSMesaDepthBuffer(GLFWwindow* window, int* width, int* height, int* bytesPerValue, void** buffer);
         """
-        width_value = ctypes.c_int(0)
-        width = ctypes.pointer(width_value)
-        height_value = ctypes.c_int(0)
-        height = ctypes.pointer(height_value)
-        bytes_per_value_value = ctypes.c_int(0)
-        bytes_per_value = ctypes.pointer(bytes_per_value_value)
-        buffer_value = ctypes.c_void_p(0)
-        buffer = ctypes.pointer(buffer_value)
-        success = _glfw.glfwGetOSMesaDepthBuffer(window, width, height, bytes_per_value, buffer)
+        width = ctypes.c_int(0)
+        height = ctypes.c_int(0)
+        bytes_per_value = ctypes.c_int(0)
+        buffer = ctypes.c_void_p(0)
+        success = _glfw.glfwGetOSMesaDepthBuffer(window,
+                                                ctypes.byref(width),
+                                                ctypes.byref(height),
+                                                ctypes.byref(bytes_per_value),
+                                                ctypes.byref(buffer))
         if not success:
             return None
         return width.value, height.value, bytes_per_value.value, buffer.value
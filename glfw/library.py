@@ -2,16 +2,11 @@
 Python bindings for GLFW.
 """
 
-from __future__ import print_function
-from __future__ import division
-from __future__ import unicode_literals
-
+import binascii
 import ctypes
 import os
-import glob
+import re
 import sys
-import subprocess
-import textwrap
 
 
 def _find_library_candidates(library_names,
@@ -20,31 +15,45 @@ def _find_library_candidates(library_names,
     """
     Finds and returns filenames which might be the library you are looking for.
     """
+    # filenames like libglfw.so, libglfw.so.3.4, glfw3.dylib or
+    # libglfw.3.dylib, with an optional lib prefix
+    names_pattern = '|'.join(re.escape(name) for name in library_names)
+    extensions_pattern = '|'.join(
+        re.escape(file_extension) for file_extension in library_file_extensions
+    )
+    basename_regex = re.compile(
+        r'(?:lib)?(?:{0})(?:(?:{1})(?:\..*)?|[0-9.]*(?:{1}))$'.format(
+            names_pattern, extensions_pattern
+        )
+    )
     candidates = []
+    # symlinks to the same library are detected by their device and inode
+    seen_files = set()
     for search_path in library_search_paths:
         if not search_path:
             continue
+        try:
+            # list each directory once instead of once per library name
+            directory_filenames = os.listdir(search_path)
+        except OSError:
+            continue
         for library_name in library_names:
-            glob_query = os.path.join(search_path, '*'+library_name+'.*')
-            for filename in glob.iglob(glob_query):
-                filename = os.path.realpath(filename)
-                if filename in candidates:
+            name_query = library_name+'.'
+            for filename in directory_filenames:
+                if name_query not in filename or filename.startswith('.'):
                     continue
-                basename = os.path.basename(filename)
-                if basename.startswith('lib'+library_name):
-                    basename_end = basename[len('lib'+library_name):]
-                elif basename.startswith(library_name):
-                    basename_end = basename[len(library_name):]
-                else:
+                if not basename_regex.match(filename):
                     continue
-                for file_extension in library_file_extensions:
-                    if basename_end.startswith(file_extension):
-                        if basename_end[len(file_extension):][:1] in ('', '.'):
-                            candidates.append(filename)
-                    elif basename_end.endswith(file_extension):
-                        basename_middle = basename_end[:-len(file_extension)]
-                        if all(c in '0123456789.' for c in basename_middle):
-                            candidates.append(filename)
+                filename = os.path.join(search_path, filename)
+                try:
+                    stat_result = os.stat(filename)
+                except OSError:
+                    continue
+                file_id = (stat_result.st_dev, stat_result.st_ino)
+                if file_id in seen_files:
+                    continue
+                seen_files.add(file_id)
+                candidates.append(filename)
     return candidates
 
 
@@ -56,9 +65,21 @@ def _load_library(library_names, library_file_extensions,
     candidates = _find_library_candidates(library_names,
                                           library_file_extensions,
                                           library_search_paths)
+    if len(candidates) == 1:
+        # a single candidate would be loaded into this process anyway, so it
+        # can be checked directly instead of in a subprocess
+        try:
+            library = ctypes.CDLL(candidates[0])
+        except OSError:
+            return None
+        version = _get_library_version(library)
+        if version is not None and version >= (3, 0, 0):
+            return library
+        return None
+
     library_versions = []
-    for filename in set(candidates):
-        version = version_check_callback(filename)
+    versions = version_check_callback(candidates)
+    for filename, version in zip(candidates, versions):
         if version is not None and version >= (3, 0, 0):
             library_versions.append((version, filename))
 
@@ -80,80 +101,131 @@ def _load_first_library(library_names, library_file_extensions,
     )
     library = None
     for filename in candidates:
-        if os.path.isfile(filename):
-            try:
-                library = ctypes.CDLL(filename)
-                break
-            except OSError:
-                pass
+        try:
+            library = ctypes.CDLL(filename)
+            break
+        except OSError:
+            pass
     if library is not None:
-        major_value = ctypes.c_int(0)
-        major = ctypes.pointer(major_value)
-        minor_value = ctypes.c_int(0)
-        minor = ctypes.pointer(minor_value)
-        rev_value = ctypes.c_int(0)
-        rev = ctypes.pointer(rev_value)
-        if hasattr(library, 'glfwGetVersion'):
-            library.glfwGetVersion(major, minor, rev)
-            version = (major_value.value, minor_value.value, rev_value.value)
-            if version >= (3, 0, 0):
-                return library
+        version = _get_library_version(library)
+        if version is not None and version >= (3, 0, 0):
+            return library
     return None
 
 
-def _glfw_get_version(filename):
+def _get_library_version(library):
     """
-    Queries and returns the library version tuple or None by using a
-    subprocess.
+    Queries and returns the version tuple of a loaded library or None.
     """
-    version_checker_source = '''
-        import sys
-        import ctypes
-
-        def get_version(library_handle):
-            """
-            Queries and returns the library version tuple or None.
-            """
-            major_value = ctypes.c_int(0)
-            major = ctypes.pointer(major_value)
-            minor_value = ctypes.c_int(0)
-            minor = ctypes.pointer(minor_value)
-            rev_value = ctypes.c_int(0)
-            rev = ctypes.pointer(rev_value)
-            if hasattr(library_handle, 'glfwGetVersion'):
-                library_handle.glfwGetVersion(major, minor, rev)
-                version = (major_value.value,
-                           minor_value.value,
-                           rev_value.value)
-                return version
-            else:
-                return None
+    if not hasattr(library, 'glfwGetVersion'):
+        return None
+    major_value = ctypes.c_int(0)
+    minor_value = ctypes.c_int(0)
+    rev_value = ctypes.c_int(0)
+    library.glfwGetVersion(ctypes.byref(major_value),
+                           ctypes.byref(minor_value),
+                           ctypes.byref(rev_value))
+    return major_value.value, minor_value.value, rev_value.value
 
-        if sys.version_info[0] == 2:
-            input_func = raw_input
-        else:
-            input_func = input
-        filename = input_func().strip()
 
-        try:
-            library_handle = ctypes.CDLL(filename)
-        except OSError:
-            pass
-        else:
-            version = get_version(library_handle)
-            print(version)
-    '''
-
-    args = [sys.executable, '-c', textwrap.dedent(version_checker_source)]
-    process = subprocess.Popen(args, universal_newlines=True,
-                               stdin=subprocess.PIPE, stdout=subprocess.PIPE)
-    out = process.communicate(filename)[0]
-    out = out.strip()
-    if out:
-        return eval(out)
+# script run in a subprocess to query the library versions without loading
+# the libraries into this process
+_version_checker_source = '''
+import sys
+import ctypes
+
+def get_version(library_handle):
+    """
+    Queries and returns the library version tuple or None.
+    """
+    major_value = ctypes.c_int(0)
+    major = ctypes.pointer(major_value)
+    minor_value = ctypes.c_int(0)
+    minor = ctypes.pointer(minor_value)
+    rev_value = ctypes.c_int(0)
+    rev = ctypes.pointer(rev_value)
+    if hasattr(library_handle, 'glfwGetVersion'):
+        library_handle.glfwGetVersion(major, minor, rev)
+        version = (major_value.value,
+                   minor_value.value,
+                   rev_value.value)
+        return version
     else:
         return None
 
+# results are prefixed with a marker to tell them apart from anything the
+# libraries print when they are loaded
+marker = sys.argv[1]
+for index, filename in enumerate(sys.stdin):
+    try:
+        library_handle = ctypes.CDLL(filename.strip())
+    except OSError:
+        version = None
+    else:
+        version = get_version(library_handle)
+    print(marker + repr((index, version)))
+    sys.stdout.flush()
+'''
+
+
+def _glfw_get_versions(filenames):
+    """
+    Queries and returns a list of library version tuples or None for the
+    given filenames by using a single subprocess.
+    """
+    if not filenames:
+        return []
+
+    # only imported when needed, as it noticeably slows down importing glfw
+    import subprocess
+
+    marker = 'pyglfw-version-' + binascii.hexlify(os.urandom(8)).decode() + ':'
+    args = [sys.executable, '-c', _version_checker_source, marker]
+    versions = [None] * len(filenames)
+    start = 0
+    while start < len(filenames):
+        process = subprocess.Popen(args, universal_newlines=True,
+                                   stdin=subprocess.PIPE,
+                                   stdout=subprocess.PIPE)
+        remaining_filenames = filenames[start:]
+        out = process.communicate('\n'.join(remaining_filenames) + '\n')[0]
+        reported_count = 0
+        for line in out.splitlines():
+            result = _parse_version_checker_line(line, marker,
+                                                 len(remaining_filenames))
+            if result is None:
+                continue
+            index, version = result
+            versions[start + index] = version
+            reported_count = max(reported_count, index + 1)
+        # if loading a library crashed the subprocess, it is treated as
+        # unusable and the remaining libraries are checked in a new subprocess
+        start += reported_count + 1
+    return versions
+
+
+def _parse_version_checker_line(line, marker, filename_count):
+    """
+    Returns the (index, version) tuple printed by the version checker or None
+    if the line is not a well-formed result, e.g. if it was printed by one of
+    the libraries.
+    """
+    if not line.startswith(marker):
+        return None
+    import ast
+    try:
+        index, version = ast.literal_eval(line[len(marker):])
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    if not isinstance(index, int) or not 0 <= index < filename_count:
+        return None
+    if version is not None:
+        if not isinstance(version, tuple) or len(version) != 3:
+            return None
+        if not all(isinstance(number, int) for number in version):
+            return None
+    return index, version
+
 
 def _get_library_search_paths():
     """
@@ -185,7 +257,16 @@ def _get_library_search_paths():
         path_environment_variable = 'LD_LIBRARY_PATH'
     if path_environment_variable in os.environ:
         search_paths.extend(os.environ[path_environment_variable].split(':'))
-    return search_paths
+
+    # skip paths that are listed more than once, e.g. in LD_LIBRARY_PATH or
+    # with a trailing slash, so that they are only scanned once
+    unique_search_paths = []
+    for search_path in search_paths:
+        if search_path:
+            search_path = os.path.normpath(search_path)
+        if search_path not in unique_search_paths:
+            unique_search_paths.append(search_path)
+    return unique_search_paths
 
 
 def _get_frozen_library_search_paths():
@@ -220,8 +301,11 @@ def _get_package_path_variant(package_path):
 if os.environ.get('PYGLFW_LIBRARY', ''):
     try:
         glfw = ctypes.CDLL(os.environ['PYGLFW_LIBRARY'])
-    except OSError:
-        glfw = None
+    except OSError as e:
+        raise ImportError(
+            "Failed to load GLFW3 shared library from PYGLFW_LIBRARY "
+            "({0}): {1}".format(os.environ['PYGLFW_LIBRARY'], e)
+        )
 elif sys.platform == 'win32':
     glfw = None  # Will become `not None` on success.
 
@@ -233,14 +317,15 @@ elif sys.platform == 'win32':
 
     # try package directory
     if glfw is None:
+        package_path = os.path.abspath(os.path.dirname(__file__))
         try:
             if sys.maxsize > 2**32:
                 # load Microsoft Visual C++ 2012 runtime on 64-bit systems
-                msvcr = ctypes.CDLL(os.path.join(os.path.abspath(os.path.dirname(__file__)), 'msvcr110.dll'))
+                msvcr = ctypes.CDLL(os.path.join(package_path, 'msvcr110.dll'))
             else:
                 # load Microsoft Visual C++ 2010 runtime on 32-bit systems
-                msvcr = ctypes.CDLL(os.path.join(os.path.abspath(os.path.dirname(__file__)), 'msvcr100.dll'))
-            glfw = ctypes.CDLL(os.path.join(os.path.abspath(os.path.dirname(__file__)), 'glfw3.dll'))
+                msvcr = ctypes.CDLL(os.path.join(package_path, 'msvcr100.dll'))
+            glfw = ctypes.CDLL(os.path.join(package_path, 'glfw3.dll'))
         except OSError:
             pass
 
@@ -252,7 +337,7 @@ elif sys.platform == 'win32':
             pass
 elif not getattr(sys, "frozen", False):
     glfw = _load_library(['glfw', 'glfw3'], ['.so', '.dylib'],
-                          _get_library_search_paths(), _glfw_get_version)
+                          _get_library_search_paths(), _glfw_get_versions)
 else:
 
     glfw = _load_first_library(['glfw', 'glfw3'], ['.so', '.dylib'],